@@ -7,6 +7,11 @@ from core.config_loader import settings
 from core.database import Base
 from models.user import User
 from models.oauth import OAuthAccount
+from models.resume import Resume
+from models.rate_limit import RateLimitBucket
+from models.revoked_token import RevokedToken
+from models.question import Question
+from models.onboarding import OnboardingSummary, OnboardingTurn
 
 from alembic import context
 
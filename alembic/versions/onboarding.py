@@ -0,0 +1,51 @@
+"""onboarding
+
+Revision ID: onboarding
+Revises: questions
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'onboarding'
+down_revision: Union[str, None] = 'questions'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('onboarding_summary',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('welcome_message', sa.Text(), nullable=True),
+        sa.Column('summary', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('user_id')
+    )
+    op.create_table('onboarding_turns',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('onboarding_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('step', sa.String(length=50), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('question', sa.Text(), nullable=False),
+        sa.Column('answer', sa.Text(), nullable=True),
+        sa.Column('answered_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['onboarding_id'], ['onboarding_summary.id'], ),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_onboarding_turns_onboarding_id', 'onboarding_turns', ['onboarding_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_onboarding_turns_onboarding_id', table_name='onboarding_turns')
+    op.drop_table('onboarding_turns')
+    op.drop_table('onboarding_summary')
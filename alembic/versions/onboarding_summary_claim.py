@@ -0,0 +1,25 @@
+"""onboarding_summary_claim
+
+Revision ID: onboarding_summary_claim
+Revises: onboarding
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'onboarding_summary_claim'
+down_revision: Union[str, None] = 'onboarding'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('onboarding_summary', sa.Column('summary_claimed_at', sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('onboarding_summary', 'summary_claimed_at')
@@ -0,0 +1,36 @@
+"""questions
+
+Revision ID: questions
+Revises: resume_summary_search
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'questions'
+down_revision: Union[str, None] = 'resume_summary_search'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('questions',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('topic', sa.String(length=100), nullable=True),
+        sa.Column('embedding', sa.LargeBinary(), nullable=False),
+        sa.Column('embedding_model', sa.String(length=100), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_questions_topic', 'questions', ['topic'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_topic', table_name='questions')
+    op.drop_table('questions')
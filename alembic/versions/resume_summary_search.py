@@ -0,0 +1,33 @@
+"""resume_summary_search
+
+Revision ID: resume_summary_search
+Revises: revoked_tokens
+Create Date: 2026-10-19 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'resume_summary_search'
+down_revision: Union[str, None] = 'revoked_tokens'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('resume', sa.Column(
+        'summary_tsv',
+        postgresql.TSVECTOR(),
+        sa.Computed("to_tsvector('english', coalesce(summary, ''))", persisted=True),
+        nullable=True
+    ))
+    op.create_index('ix_resume_summary_tsv', 'resume', ['summary_tsv'], postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_resume_summary_tsv', table_name='resume')
+    op.drop_column('resume', 'summary_tsv')
@@ -0,0 +1,49 @@
+"""resume_version
+
+Revision ID: resume_version
+Revises: initial_uuid_schema
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'resume_version'
+down_revision: Union[str, None] = 'initial_uuid_schema'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Marks a resume table this revision created, so downgrade drops it again
+CREATED_COMMENT = 'created by resume_version'
+
+
+def upgrade() -> None:
+    # The resume table predates the migrations on some databases
+    if not sa.inspect(op.get_bind()).has_table('resume'):
+        op.create_table('resume',
+            sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+            sa.Column('resume_path', sa.String(), nullable=True),
+            sa.Column('linkedin_url', sa.String(), nullable=True),
+            sa.Column('summary', sa.Text(), nullable=True),
+            sa.Column('uploaded_at', sa.DateTime(), nullable=False),
+            sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+            sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('user_id'),
+            comment=CREATED_COMMENT
+        )
+    else:
+        op.add_column('resume', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    comment = sa.inspect(op.get_bind()).get_table_comment('resume').get('text')
+    if comment == CREATED_COMMENT:
+        op.drop_table('resume')
+    else:
+        op.drop_column('resume', 'version')
@@ -1,16 +1,37 @@
+import hmac
+import logging
+import time
+from typing import Optional
 from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.security import APIKeyHeader, HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from core.database import get_db
-from auth.jwt import decode_token
+from core.database import SessionLocal, get_read_db
+from auth.jwt import ACCESS_TOKEN_EXPIRE_HOURS, decode_token
+from core.config_loader import settings
+from core.runtime import get_runtime
 from models.user import User
 from services.user_service import UserService
 
+logger = logging.getLogger(__name__)
+
 security = HTTPBearer()
+internal_token = APIKeyHeader(name="X-Internal-Token", auto_error=False)
+
+
+def _is_access_token(payload: dict) -> bool:
+    token_type = payload.get("type")
+    if token_type is not None:
+        return token_type == "access"
+    # Untyped tokens predate the type claim. One that outlives any access
+    # token can only be an old refresh token
+    if not settings.ACCEPT_UNTYPED_TOKENS or payload.get("exp", 0) > time.time() + ACCESS_TOKEN_EXPIRE_HOURS * 3600:
+        return False
+    logger.warning("Accepted untyped access token", extra={"expires_at": payload.get("exp")})
+    return True
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ) -> User:
     # Get token from request
     token = credentials.credentials
@@ -19,12 +40,17 @@ async def get_current_user(
     payload = decode_token(token)
     email = payload.get("sub")
     
-    if not email:
+    if not email or not _is_access_token(payload):
         raise HTTPException(status_code=401, detail="Invalid token")
     
     # Get user from database
     user_service = UserService(db)
     user = user_service.get_user_by_email(email)
+    if (user is None or not user.is_active) and db.info.get("replica"):
+        # A lagging replica may not have a user the login just created or
+        # reactivated yet; the primary has the final say
+        with SessionLocal() as primary:
+            user = UserService(primary).get_user_by_email(email)
     
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
@@ -46,3 +72,9 @@ async def get_current_active_user(
             detail="Inactive user"
         )
     return current_user
+
+def require_internal(token: Optional[str] = Depends(internal_token)) -> None:
+    """Guard for operator endpoints; closed while INTERNAL_API_TOKEN is unset"""
+    expected = get_runtime().settings.INTERNAL_API_TOKEN
+    if not expected or not token or not hmac.compare_digest(token.encode(), expected.encode()):
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
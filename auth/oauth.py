@@ -1,10 +1,11 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 from datetime import datetime
-from core.config_loader import settings
+from core.runtime import get_runtime
 from schemas.oauth import OAuthUserInfo
 from models.oauth import OAuthProviderEnum
-from auth.jwt import create_access_token, create_refresh_token
+from auth.jwt import create_access_token, create_refresh_token, decode_token
+from auth.revocation import revoked_tokens
 from services.oauth_helpers import (
     exchange_code_for_token,
     fetch_user_info,
@@ -21,16 +22,17 @@ async def oauth_login(provider: str, code: str, db: Session) -> dict:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported OAuth provider")
 
 async def _google_oauth_login(code: str, db: Session) -> dict:
+    provider = get_runtime().oauth_providers["google"]
     token_data = {
-        "client_id": settings.GOOGLE_CLIENT_ID,
-        "client_secret": settings.GOOGLE_CLIENT_SECRET,
+        "client_id": provider.client_id,
+        "client_secret": provider.client_secret,
         "code": code,
         "grant_type": "authorization_code",
-        "redirect_uri": "http://127.0.0.1:8000/api/auth/google/callback",
+        "redirect_uri": provider.redirect_uri,
     }
 
-    token_json = await exchange_code_for_token("https://oauth2.googleapis.com/token", token_data)
-    user_data = await fetch_user_info("https://www.googleapis.com/oauth2/v2/userinfo", token_json["access_token"])
+    token_json = await exchange_code_for_token(provider.token_url, token_data)
+    user_data = await fetch_user_info(provider.userinfo_url, token_json["access_token"])
 
     oauth_user_info = OAuthUserInfo(
         email=user_data["email"],
@@ -48,18 +50,19 @@ async def _google_oauth_login(code: str, db: Session) -> dict:
     return _create_tokens(user)
 
 async def _linkedin_oauth_login(code: str, db: Session) -> dict:
+    provider = get_runtime().oauth_providers["linkedin"]
     token_data = {
         "grant_type": "authorization_code",
         "code": code,
-        "redirect_uri": "http://127.0.0.1:8000/api/auth/linkedin/callback",
-        "client_id": settings.LINKEDIN_CLIENT_ID,
-        "client_secret": settings.LINKEDIN_CLIENT_SECRET,
-        "scope": "openid profile email"
+        "redirect_uri": provider.redirect_uri,
+        "client_id": provider.client_id,
+        "client_secret": provider.client_secret,
+        "scope": provider.scope
     }
 
-    token_json = await exchange_code_for_token("https://www.linkedin.com/oauth/v2/accessToken", token_data)
+    token_json = await exchange_code_for_token(provider.token_url, token_data)
 
-    userinfo = await fetch_user_info("https://api.linkedin.com/v2/userinfo", token_json["access_token"])
+    userinfo = await fetch_user_info(provider.userinfo_url, token_json["access_token"])
     email = userinfo.get("email")
     first_name = userinfo.get("given_name")
 
@@ -78,9 +81,32 @@ async def _linkedin_oauth_login(code: str, db: Session) -> dict:
     
     return _create_tokens(user)
 
+def refresh_tokens(refresh_token: str, db: Session) -> dict:
+    """Rotate a refresh token into a new token pair without calling the provider"""
+    payload = decode_token(refresh_token)
+    email = payload.get("sub")
+    jti = payload.get("jti")
+    if payload.get("type") != "refresh" or not email or not jti:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+
+    # A deleted or deactivated user must not keep minting tokens
+    user = UserService(db).get_user_by_email(email)
+    if user is None or not user.is_active:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User inactive")
+
+    # revoke() fails if the token was already rotated, so a replayed token is rejected
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    if not revoked_tokens.revoke(db, jti, expires_at):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Refresh token revoked")
+
+    return _create_tokens(user)
+
 def _create_tokens(user) -> dict:
+    return _issue_tokens(user.email)
+
+def _issue_tokens(email: str) -> dict:
     return {
-        "access_token": create_access_token(data={"sub": user.email}),
-        "refresh_token": create_refresh_token(data={"sub": user.email}),
+        "access_token": create_access_token(data={"sub": email}),
+        "refresh_token": create_refresh_token(data={"sub": email}),
         "token_type": "bearer"
     }
@@ -0,0 +1,37 @@
+import itertools
+from datetime import datetime
+from sqlalchemy import delete
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+from models.revoked_token import RevokedToken
+
+
+class RevokedTokens:
+    """Refresh tokens that were already rotated, kept in ``revoked_tokens``.
+
+    Rotation is a single insert: the primary key on ``jti`` makes it fail for
+    a token that was used before, in any worker, so replays are caught without
+    reading the table first. Rows are only needed until the token expires, as
+    an expired token is rejected when it is decoded; every ``PRUNE_EVERY``
+    revocations the expired ones are deleted.
+    """
+
+    PRUNE_EVERY = 1000
+
+    def __init__(self):
+        self._calls = itertools.count(1)
+
+    def revoke(self, db: Session, jti: str, expires_at: datetime) -> bool:
+        """Record ``jti`` as revoked; return False if it already was."""
+        now = datetime.utcnow()
+        stmt = insert(RevokedToken).values(
+            jti=jti, expires_at=expires_at, revoked_at=now
+        ).on_conflict_do_nothing(index_elements=[RevokedToken.jti]).returning(RevokedToken.jti)
+        inserted = db.execute(stmt).first() is not None
+        if next(self._calls) % self.PRUNE_EVERY == 0:
+            db.execute(delete(RevokedToken).where(RevokedToken.expires_at < now))
+        db.commit()
+        return inserted
+
+
+revoked_tokens = RevokedTokens()
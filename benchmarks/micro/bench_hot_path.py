@@ -0,0 +1,79 @@
+"""Micro-benchmarks for the code every authenticated request runs.
+
+Run with ``python -m benchmarks.micro.history`` to record results, or
+directly with ``pytest benchmarks/micro``.
+"""
+from fastapi.security import HTTPAuthorizationCredentials
+
+from auth.dependencies import get_current_user
+from auth.jwt import create_access_token, decode_token
+from core.config import parse_cors
+from core.security import decrypt_token, encrypt_token
+from schemas.user import UserResponse
+from utils.linkedin_scrapper import convert_linkedin_url_to_id
+
+
+class _StubQuery:
+    def __init__(self, result):
+        self.result = result
+
+    def filter(self, *args, **kwargs):
+        return self
+
+    def first(self):
+        return self.result
+
+
+class _StubSession:
+    """Just enough of ``Session`` for ``UserService.get_user_by_email``."""
+
+    def __init__(self, user):
+        self.user = user
+
+    def query(self, *args):
+        return _StubQuery(self.user)
+
+
+def _run_coroutine(coro):
+    # get_current_user never awaits, so drive it without an event loop
+    try:
+        coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    raise RuntimeError("coroutine suspended")
+
+
+def bench_decode_token(benchmark, user):
+    token = create_access_token(data={"sub": user.email})
+    payload = benchmark(decode_token, token)
+    assert payload["sub"] == user.email
+
+
+def bench_user_response_serialisation(benchmark, user):
+    body = benchmark(lambda: UserResponse.model_validate(user).model_dump_json())
+    assert user.email in body
+
+
+def bench_get_current_user(benchmark, user):
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=create_access_token(data={"sub": user.email}))
+    db = _StubSession(user)
+    result = benchmark(lambda: _run_coroutine(get_current_user(credentials, db)))
+    assert result is user
+
+
+def bench_encrypt_token(benchmark):
+    assert benchmark(encrypt_token, "ya29.a0AfH6SMB-provider-access-token")
+
+
+def bench_decrypt_token(benchmark):
+    encrypted = encrypt_token("ya29.a0AfH6SMB-provider-access-token")
+    assert benchmark(decrypt_token, encrypted) == "ya29.a0AfH6SMB-provider-access-token"
+
+
+def bench_parse_cors(benchmark):
+    origins = "http://localhost, http://localhost:5173, https://app.example.com, https://admin.example.com"
+    assert len(benchmark(parse_cors, origins)) == 4
+
+
+def bench_convert_linkedin_url_to_id(benchmark):
+    assert benchmark(convert_linkedin_url_to_id, "https://www.linkedin.com/in/ada-lovelace/") == "ada-lovelace"
@@ -0,0 +1,39 @@
+"""Question retrieval latency for a single interview-turn query.
+
+Uses clustered random vectors so the IVF index sees realistic structure.
+"""
+import numpy as np
+import pytest
+
+from utils.vector_index import ExactIndex, IVFIndex
+
+DIM = 256
+
+
+def _bank(size: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(max(size // 300, 1), DIM))
+    return (centers[rng.integers(0, len(centers), size)] + 0.3 * rng.normal(size=(size, DIM))).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def query():
+    return _bank(1, seed=1)
+
+
+@pytest.fixture(scope="module", params=[1_000, 10_000], ids=lambda n: f"{n}")
+def exact_index(request):
+    return ExactIndex(_bank(request.param), list(range(request.param)))
+
+
+@pytest.fixture(scope="module")
+def ivf_index():
+    return IVFIndex(_bank(100_000), list(range(100_000)))
+
+
+def bench_exact_top10(benchmark, exact_index, query):
+    assert len(benchmark(exact_index.search, query, 10)[0]) == 10
+
+
+def bench_ivf_top10_100k(benchmark, ivf_index, query):
+    assert len(benchmark(ivf_index.search, query, 10)[0]) == 10
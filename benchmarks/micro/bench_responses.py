@@ -0,0 +1,35 @@
+"""List response serialisation: FastAPI's generic path against ``encode_list``.
+
+The "generic" cases reproduce what a ``response_model=List[...]`` route did
+before: validate into models, run ``jsonable_encoder`` and render with the
+stdlib ``json`` module.
+"""
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+import pytest
+
+from benchmarks.micro.conftest import make_user
+from core.responses import encode_list
+from schemas.user import UserListAdapter, UserListResponse
+
+SIZES = [100, 10_000]
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda size: f"{size}")
+def users(request):
+    return [make_user(i) for i in range(request.param)]
+
+
+def _generic_response(rows):
+    models = [UserListResponse.model_validate(row) for row in rows]
+    return JSONResponse(jsonable_encoder(models)).body
+
+
+def bench_list_generic(benchmark, users):
+    benchmark.group = f"users-list-{len(users)}"
+    assert benchmark(_generic_response, users)
+
+
+def bench_list_encode_list(benchmark, users):
+    benchmark.group = f"users-list-{len(users)}"
+    assert benchmark(encode_list, UserListAdapter, users)
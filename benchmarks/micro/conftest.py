@@ -0,0 +1,48 @@
+import os
+from datetime import datetime, timezone
+import uuid
+
+import pytest
+
+# Settings() needs these at import time; real values are never used here
+_BENCH_ENV = {
+    "SECRET_KEY": "benchmark-secret-key-benchmark-secret-key",
+    "GOOGLE_CLIENT_ID": "bench",
+    "GOOGLE_CLIENT_SECRET": "bench",
+    "GEMINI_API_KEY": "bench",
+    "LINKEDIN_CLIENT_ID": "bench",
+    "LINKEDIN_CLIENT_SECRET": "bench",
+    "LINKEDIN_EMAIL": "bench",
+    "LINKEDIN_PASSWORD": "bench",
+    "FRONTEND_URL": "http://localhost:3000",
+    "POSTGRESQL_USERNAME": "bench",
+    "POSTGRESQL_PASSWORD": "bench",
+    "POSTGRESQL_SERVER": "localhost",
+    "POSTGRESQL_PORT": "5432",
+    "POSTGRESQL_DATABASE": "bench",
+}
+for key, value in _BENCH_ENV.items():
+    os.environ.setdefault(key, value)
+
+
+def make_user(index: int = 0):
+    import models.oauth  # noqa: F401  (resolve the User.oauth_accounts relationship)
+    from models.user import User
+
+    now = datetime.now(timezone.utc)
+    return User(
+        id=uuid.uuid4(),
+        email=f"user{index}@example.com",
+        first_name="Ada",
+        last_name="Lovelace",
+        avatar_url="https://example.com/avatar.png",
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+        last_login_at=now,
+    )
+
+
+@pytest.fixture
+def user():
+    return make_user()
@@ -0,0 +1,91 @@
+"""Run the micro-benchmarks and track them in a JSON history.
+
+Every run appends the mean/median/stddev of each benchmark, keyed by commit,
+to ``benchmarks/results/micro_history.json`` and compares the means against
+the previous entry. The command exits non-zero when any benchmark got slower
+than ``--threshold`` (a fraction, default 0.15), so it can gate a dependency
+bump or a refactor::
+
+    python -m benchmarks.micro.history
+    python -m benchmarks.micro.history --threshold 0.25 --no-save
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+
+from benchmarks.results import RESULTS_DIR, current_commit
+
+MICRO_DIR = os.path.dirname(os.path.abspath(__file__))
+HISTORY_PATH = os.path.join(RESULTS_DIR, "micro_history.json")
+
+
+def run_benchmarks(extra_args: list[str]) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "bench.json")
+        subprocess.run(
+            [sys.executable, "-m", "pytest", MICRO_DIR, "-q", f"--benchmark-json={json_path}", *extra_args],
+            check=True,
+        )
+        with open(json_path) as f:
+            raw = json.load(f)
+    return {
+        bench["name"]: {
+            "mean_us": bench["stats"]["mean"] * 1e6,
+            "median_us": bench["stats"]["median"] * 1e6,
+            "stddev_us": bench["stats"]["stddev"] * 1e6,
+            "rounds": bench["stats"]["rounds"],
+        }
+        for bench in raw["benchmarks"]
+    }
+
+
+def load_history(path: str = HISTORY_PATH) -> list[dict]:
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def find_regressions(current: dict, previous: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, stats in current.items():
+        before = previous.get(name)
+        if before and stats["mean_us"] > before["mean_us"] * (1 + threshold):
+            change = stats["mean_us"] / before["mean_us"] - 1
+            regressions.append(f"{name}: {before['mean_us']:.2f}us -> {stats['mean_us']:.2f}us (+{change:.0%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=float, default=0.15)
+    parser.add_argument("--no-save", action="store_true", help="Compare only, do not append to the history")
+    parser.add_argument("pytest_args", nargs="*", help="Extra arguments passed to pytest")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.pytest_args)
+    history = load_history()
+    regressions = find_regressions(results, history[-1]["benchmarks"], args.threshold) if history else []
+
+    if not args.no_save:
+        history.append({
+            "commit": current_commit(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "benchmarks": results,
+        })
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        with open(HISTORY_PATH, "w") as f:
+            json.dump(history, f, indent=2, sort_keys=True)
+
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""Routing check for read replicas against separate local Postgres instances.
+
+The instances are not replicating; each gets its own copy of a test user
+whose first name names the instance, so every response shows which database
+answered it. The app is configured through the environment exactly like a
+deployment (``POSTGRESQL_*`` for the primary, ``POSTGRESQL_REPLICA_HOSTS``
+for the replicas, which share the primary's credentials and database) and
+driven with ``TestClient``. Checks:
+
+* ``GET /api/users/me`` is answered by the replicas, round-robin,
+* an unreachable replica is skipped and reads still succeed,
+* after ``PUT /api/users/me`` the client reads its own write from the primary,
+  while a client without the sticky cookie still reads a replica,
+* a user that so far only exists on the primary (replication lag right after
+  a login) is still authenticated.
+
+::
+
+    python -m benchmarks.replica_routing --docker
+    python -m benchmarks.replica_routing --primary postgresql://u:p@localhost:5433/scratch \\
+        --replica localhost:5434 --replica localhost:5435
+
+Exits non-zero on the first violated check.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+
+def _configure_environment(primary: str, replicas: list[str]) -> None:
+    url = make_url(primary)
+    os.environ.update(
+        {
+            "POSTGRESQL_USERNAME": url.username,
+            "POSTGRESQL_PASSWORD": url.password or "",
+            "POSTGRESQL_SERVER": url.host,
+            "POSTGRESQL_PORT": str(url.port or 5432),
+            "POSTGRESQL_DATABASE": url.database,
+            "POSTGRESQL_REPLICA_HOSTS": ",".join(replicas),
+            "READ_YOUR_WRITES_SECONDS": "30",
+        }
+    )
+    # Settings() needs these at import time; none of them is used here
+    for key, value in {
+        "SECRET_KEY": "replica-routing-secret-key-replica-routing",
+        "GOOGLE_CLIENT_ID": "routing",
+        "GOOGLE_CLIENT_SECRET": "routing",
+        "LINKEDIN_CLIENT_ID": "routing",
+        "LINKEDIN_CLIENT_SECRET": "routing",
+        "LINKEDIN_EMAIL": "routing",
+        "LINKEDIN_PASSWORD": "routing",
+        "GEMINI_API_KEY": "routing",
+        "FRONTEND_URL": "http://localhost:3000",
+    }.items():
+        os.environ.setdefault(key, value)
+
+
+def _seed(dsn: str, users: dict[str, tuple[uuid.UUID, str]]) -> None:
+    """Create the users table on one instance and store ``{email: (id, first_name)}``.
+
+    Ids are shared between instances, as replication would keep them: tokens
+    name the user by email, but writes go to the primary by the id the
+    authenticating read returned.
+    """
+    from core.database import Base
+    import models.oauth  # noqa: F401  (resolve the User.oauth_accounts relationship)
+    from models.user import User
+
+    engine = create_engine(dsn)
+    try:
+        Base.metadata.create_all(engine, tables=[User.__table__])
+        with Session(engine) as db:
+            db.query(User).filter(User.email.in_(list(users))).delete(synchronize_session=False)
+            now = datetime.now(timezone.utc)
+            for email, (user_id, first_name) in users.items():
+                db.add(User(id=user_id, email=email, first_name=first_name, is_active=True,
+                            created_at=now, updated_at=now))
+            db.commit()
+    finally:
+        engine.dispose()
+
+
+def _replica_dsn(primary: str, host: str) -> str:
+    url = make_url(primary)
+    name, _, port = host.partition(":")
+    return url.set(host=name, port=int(port) if port else url.port).render_as_string(hide_password=False)
+
+
+def run_checks(primary: str, replicas: list[str]) -> list[str]:
+    from fastapi.testclient import TestClient
+    from auth.jwt import create_access_token
+    from main import app
+
+    # example.com: UserResponse rejects reserved domains such as .local
+    alice = f"alice-{uuid.uuid4().hex[:8]}@example.com"
+    bob = f"bob-{uuid.uuid4().hex[:8]}@example.com"
+    alice_id, bob_id = uuid.uuid4(), uuid.uuid4()
+    _seed(primary, {alice: (alice_id, "primary"), bob: (bob_id, "primary")})
+    for index, host in enumerate(replicas):
+        _seed(_replica_dsn(primary, host), {alice: (alice_id, f"replica-{index}")})
+    replica_names = {f"replica-{index}" for index in range(len(replicas))}
+
+    def client_for(email: str) -> TestClient:
+        client = TestClient(app)
+        client.headers["Authorization"] = f"Bearer {create_access_token({'sub': email})}"
+        return client
+
+    def first_name(client: TestClient) -> str:
+        response = client.get("/api/users/me")
+        if response.status_code != 200:
+            return f"HTTP {response.status_code}"
+        return response.json()["first_name"]
+
+    failures = []
+    reader = client_for(alice)
+    seen = {first_name(reader) for _ in range(4 * len(replicas))}
+    if seen != replica_names:
+        failures.append(f"reads were answered by {sorted(seen)}, expected round-robin over {sorted(replica_names)}")
+
+    writer = client_for(alice)
+    response = writer.put("/api/users/me", json={"first_name": "updated"})
+    if response.status_code != 200:
+        failures.append(f"PUT /api/users/me failed with HTTP {response.status_code}")
+    elif "db_primary_until" not in writer.cookies:
+        failures.append("a write did not set the sticky-primary cookie")
+    else:
+        read_back = {first_name(writer) for _ in range(2 * len(replicas))}
+        if read_back != {"updated"}:
+            failures.append(f"the writer read {sorted(read_back)} after its write instead of the primary's value")
+        others = {first_name(client_for(alice)) for _ in range(2 * len(replicas))}
+        if not others <= replica_names:
+            failures.append(f"a client without the sticky cookie read {sorted(others)} instead of a replica")
+
+    lagging = first_name(client_for(bob))
+    if lagging != "primary":
+        failures.append(f"a user missing from the replicas got {lagging} instead of the primary's row")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--primary", help="Scratch Postgres DSN of the primary")
+    target.add_argument("--docker", action="store_true", help="Start disposable postgres:17 containers")
+    parser.add_argument("--replica", action="append", default=[],
+                        help="host[:port] of a replica with the primary's credentials (repeatable)")
+    parser.add_argument("--replicas", type=int, default=2, help="Replica containers to start with --docker")
+    args = parser.parse_args()
+
+    containers = []
+    try:
+        primary, replicas = args.primary, list(args.replica)
+        if args.docker:
+            from benchmarks.loadtest import _start_postgres_container
+
+            name, primary = _start_postgres_container()
+            containers.append(name)
+            for _ in range(args.replicas):
+                name, dsn = _start_postgres_container()
+                containers.append(name)
+                url = make_url(dsn)
+                replicas.append(f"{url.host}:{url.port}")
+        if not replicas:
+            parser.error("at least one --replica is required")
+
+        from benchmarks.loadtest import _free_port
+
+        # Nothing listens here; routing must skip it and keep serving reads
+        unreachable = f"127.0.0.1:{_free_port()}"
+        _configure_environment(primary, replicas + [unreachable])
+        failures = run_checks(primary, replicas)
+    finally:
+        for name in containers:
+            subprocess.run(["docker", "rm", "-f", name], stdout=subprocess.DEVNULL)
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    if not failures:
+        print(f"ok: reads routed over {len(replicas)} replicas, writes read back from the primary")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""Helpers for writing and comparing machine-readable benchmark results."""
+import json
+import os
+import subprocess
+from datetime import datetime, timezone
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def current_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def percentile(sorted_values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def save_result(result: dict, path: str | None = None) -> str:
+    result = {"commit": current_commit(), "timestamp": datetime.now(timezone.utc).isoformat(), **result}
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{result['kind']}-{result['commit']}.json")
+    with open(path, "w") as f:
+        json.dump(result, f, indent=2, sort_keys=True)
+    return path
+
+
+def load_result(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_scenarios(current: dict, baseline: dict, max_regression: float) -> list[str]:
+    """Return human readable regressions of ``current`` against ``baseline``.
+
+    A scenario regresses when its p95 latency grows, or its throughput drops,
+    by more than ``max_regression`` (a fraction, e.g. ``0.1`` for 10%).
+    """
+    regressions = []
+    for name, stats in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if not base:
+            continue
+        if base["p95_ms"] and stats["p95_ms"] > base["p95_ms"] * (1 + max_regression):
+            regressions.append(f"{name}: p95 {base['p95_ms']:.1f}ms -> {stats['p95_ms']:.1f}ms")
+        if base["rps"] and stats["rps"] < base["rps"] * (1 - max_regression):
+            regressions.append(f"{name}: throughput {base['rps']:.1f}/s -> {stats['rps']:.1f}/s")
+    return regressions
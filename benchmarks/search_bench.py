@@ -0,0 +1,149 @@
+"""Resume search: full-text index against ILIKE scans.
+
+Seeds ``--rows`` synthetic users and resumes into a private ``search_bench``
+schema of the given database, then times ranked full-text search (the query
+behind ``GET /api/resumes/search``) against ILIKE scans for the same terms.
+The schema is dropped afterwards unless ``--keep`` is passed::
+
+    python -m benchmarks.search_bench --dsn postgresql://u:p@localhost:5433/scratch --rows 100000
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime
+
+from psycopg2.extras import execute_values
+from sqlalchemy import create_engine, text
+
+from benchmarks.results import percentile, save_result
+
+SCHEMA = "search_bench"
+
+VOCABULARY = (
+    "python java golang rust typescript react kubernetes docker terraform aws gcp azure postgresql mysql "
+    "redis kafka spark airflow pandas pytorch tensorflow fastapi django flask graphql grpc microservices "
+    "leadership mentoring hiring roadmap stakeholder agile scrum product analytics marketing sales finance "
+    "design figma accessibility security compliance devops observability oncall migration scalability"
+).split()
+FILLER = "experienced engineer team delivered built owned improved across company projects worked with".split()
+
+SEARCH_TERMS = ["kubernetes", "pytorch", "leadership", "figma", "graphql"]
+
+
+def _summary(rng: random.Random) -> str:
+    words = rng.choices(VOCABULARY, k=12) + rng.choices(FILLER, k=60)
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+# Mirrors the resume table and the resume_summary_search migration
+SCHEMA_DDL = [
+    """CREATE TABLE users (
+        id UUID PRIMARY KEY, email VARCHAR(64) NOT NULL UNIQUE, is_active BOOLEAN,
+        created_at TIMESTAMP NOT NULL, updated_at TIMESTAMP
+    )""",
+    """CREATE TABLE resume (
+        id UUID PRIMARY KEY, user_id UUID NOT NULL UNIQUE REFERENCES users (id),
+        resume_path VARCHAR, linkedin_url VARCHAR, summary TEXT,
+        uploaded_at TIMESTAMP NOT NULL, version INTEGER NOT NULL DEFAULT 1,
+        summary_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', coalesce(summary, ''))) STORED
+    )""",
+    "CREATE INDEX ix_resume_summary_tsv ON resume USING gin (summary_tsv)",
+]
+
+
+def seed(conn, rows: int, batch: int = 5000) -> None:
+    for statement in SCHEMA_DDL:
+        conn.execute(text(statement))
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    raw = conn.connection.dbapi_connection
+    with raw.cursor() as cursor:
+        for start in range(0, rows, batch):
+            count = min(batch, rows - start)
+            user_ids = [uuid.uuid4() for _ in range(count)]
+            execute_values(
+                cursor,
+                "INSERT INTO users (id, email, is_active, created_at, updated_at) VALUES %s",
+                [(str(uid), f"bench{start + i}@example.com", True, now, now) for i, uid in enumerate(user_ids)],
+            )
+            execute_values(
+                cursor,
+                "INSERT INTO resume (id, user_id, summary, uploaded_at, version) VALUES %s",
+                [(str(uuid.uuid4()), str(uid), _summary(rng), now, 1) for uid in user_ids],
+            )
+    conn.execute(text("ANALYZE users"))
+    conn.execute(text("ANALYZE resume"))
+
+
+QUERIES = {
+    "fts_ranked_top20": text("""
+        SELECT id, ts_rank_cd(summary_tsv, q) AS rank
+        FROM resume, websearch_to_tsquery('english', :term) AS q
+        WHERE summary_tsv @@ q
+        ORDER BY rank DESC, id LIMIT 20
+    """),
+    "fts_count": text("SELECT count(*) FROM resume WHERE summary_tsv @@ websearch_to_tsquery('english', :term)"),
+    "ilike_first20": text("SELECT id FROM resume WHERE summary ILIKE '%' || :term || '%' ORDER BY id LIMIT 20"),
+    "ilike_count": text("SELECT count(*) FROM resume WHERE summary ILIKE '%' || :term || '%'"),
+}
+
+
+def time_queries(conn, repeat: int) -> dict:
+    results = {}
+    for name, query in QUERIES.items():
+        timings = []
+        for _ in range(repeat):
+            for term in SEARCH_TERMS:
+                start = time.perf_counter()
+                conn.execute(query, {"term": term}).all()
+                timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        results[name] = {
+            "count": len(timings),
+            "mean_ms": statistics.fmean(timings),
+            "p50_ms": percentile(timings, 50),
+            "p95_ms": percentile(timings, 95),
+            "p99_ms": percentile(timings, 99),
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", required=True, help="Scratch Postgres DSN")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per query and search term")
+    parser.add_argument("--keep", action="store_true", help="Keep the seeded schema for reruns")
+    parser.add_argument("--out", help="Result path (default benchmarks/results/search-<commit>.json)")
+    args = parser.parse_args()
+
+    engine = create_engine(args.dsn, connect_args={"options": f"-csearch_path={SCHEMA}"})
+    with engine.begin() as conn:
+        exists = conn.execute(text("SELECT 1 FROM pg_namespace WHERE nspname = :s"), {"s": SCHEMA}).first()
+        if not exists:
+            conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+            started = time.perf_counter()
+            seed(conn, args.rows)
+            print(f"seeded {args.rows} resumes in {time.perf_counter() - started:.1f}s")
+    try:
+        with engine.connect() as conn:
+            scenarios = time_queries(conn, args.repeat)
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+
+    for name, stats in scenarios.items():
+        print(f"{name:<18} p50 {stats['p50_ms']:8.2f}ms  p95 {stats['p95_ms']:8.2f}ms  p99 {stats['p99_ms']:8.2f}ms")
+    path = save_result({"kind": "search", "config": {"rows": args.rows, "repeat": args.repeat}, "scenarios": scenarios}, args.out)
+    print(f"saved {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""Boot ``main.app`` for load testing.
+
+Creates the schema on the target database and wraps the app in a middleware
+that reports the number of SQL statements each request issued through the
+``X-DB-Queries`` response header. Configuration comes from the environment,
+exactly like a normal deployment.
+"""
+import argparse
+import contextvars
+from sqlalchemy import event
+import uvicorn
+
+from core.database import Base, engine
+from main import app
+import models.oauth  # noqa: F401  (register tables on Base.metadata)
+import models.user  # noqa: F401
+
+_query_counter: contextvars.ContextVar[list | None] = contextvars.ContextVar("query_counter", default=None)
+
+
+@event.listens_for(engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class QueryCountMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        counter = [0]
+        token = _query_counter.set(counter)
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-queries", str(counter[0]).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _query_counter.reset(token)
+
+
+def create_schema() -> None:
+    Base.metadata.create_all(engine)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8100)
+    args = parser.parse_args()
+    create_schema()
+    uvicorn.run(QueryCountMiddleware(app), host="127.0.0.1", port=args.port, log_level="warning")
@@ -0,0 +1,77 @@
+"""Local stand-ins for Google/LinkedIn OAuth and Gemini.
+
+The OAuth stubs treat the authorization code as the user handle: exchanging
+``code=alice`` yields an access token ``alice`` whose userinfo resolves to
+``alice@loadtest.local``. Gemini answers every ``generateContent`` call with a
+fixed summary after an optional artificial delay.
+
+Run standalone with ``python -m benchmarks.stubs --port 9100``.
+"""
+import argparse
+import asyncio
+from fastapi import FastAPI, Form, Header
+import uvicorn
+
+STUB_DOMAIN = "loadtest.local"
+
+FAKE_SUMMARY = (
+    "Seasoned backend engineer with experience in Python, FastAPI, PostgreSQL "
+    "and distributed systems. Led migrations, mentored engineers and owned "
+    "on-call for latency sensitive services. "
+) * 8
+
+
+def create_stub_app(llm_delay: float = 0.0) -> FastAPI:
+    app = FastAPI()
+
+    def _handle_from_bearer(authorization: str) -> str:
+        return authorization.removeprefix("Bearer ").strip()
+
+    @app.post("/google/token")
+    async def google_token(code: str = Form(...)):
+        return {"access_token": code, "expires_in": 3599, "token_type": "Bearer"}
+
+    @app.get("/google/userinfo")
+    async def google_userinfo(authorization: str = Header(...)):
+        handle = _handle_from_bearer(authorization)
+        return {"id": f"g-{handle}", "email": f"{handle}@{STUB_DOMAIN}", "given_name": handle}
+
+    @app.post("/linkedin/token")
+    async def linkedin_token(code: str = Form(...)):
+        return {"access_token": code, "expires_in": 5183999}
+
+    @app.get("/linkedin/userinfo")
+    async def linkedin_userinfo(authorization: str = Header(...)):
+        handle = _handle_from_bearer(authorization)
+        return {"sub": f"li-{handle}", "email": f"{handle}@{STUB_DOMAIN}", "given_name": handle}
+
+    @app.post("/gemini/{version}/models/{model_action}")
+    async def gemini_generate(version: str, model_action: str):
+        if llm_delay:
+            await asyncio.sleep(llm_delay)
+        return {
+            "candidates": [
+                {"content": {"role": "model", "parts": [{"text": FAKE_SUMMARY}]}, "finishReason": "STOP"}
+            ]
+        }
+
+    return app
+
+
+def stub_settings(base_url: str) -> dict:
+    """Environment overrides that point the app at a running stub server."""
+    return {
+        "GOOGLE_TOKEN_URL": f"{base_url}/google/token",
+        "GOOGLE_USERINFO_URL": f"{base_url}/google/userinfo",
+        "LINKEDIN_TOKEN_URL": f"{base_url}/linkedin/token",
+        "LINKEDIN_USERINFO_URL": f"{base_url}/linkedin/userinfo",
+        "GEMINI_BASE_URL": f"{base_url}/gemini",
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--llm-delay", type=float, default=0.0, help="Seconds each fake Gemini call sleeps")
+    args = parser.parse_args()
+    uvicorn.run(create_stub_app(args.llm_delay), host="127.0.0.1", port=args.port, log_level="warning")
@@ -0,0 +1,127 @@
+"""Throughput of ``serve.py`` with one worker against several on this machine.
+
+Starts the OAuth/Gemini stand-ins once, then for each ``--workers`` value
+boots the production entry point (``serve.py``) against the same database and
+drives the same request mix through it. Every configuration gets the same
+``POSTGRES_CONNECTION_BUDGET``, so the pools shrink as workers are added,
+exactly as in a deployment::
+
+    python -m benchmarks.workers_bench --docker --workers 1,4 --mix reads --duration 20
+    python -m benchmarks.workers_bench --dsn postgresql://u:p@localhost:5433/scratch
+
+Writes ``benchmarks/results/workers-<commit>.json`` with one scenario per
+worker count (``<n>w``) holding overall throughput and latency percentiles.
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.loadtest import (
+    MIXES,
+    REPO_ROOT,
+    LoadTest,
+    _app_environment,
+    _free_port,
+    _start_postgres_container,
+    _wait_for_http,
+)
+from benchmarks.results import percentile, save_result
+from serve import available_cpus
+
+
+def _run_configuration(env: dict, workers: int, args, workdir: str) -> dict:
+    port = _free_port()
+    server = subprocess.Popen(
+        [sys.executable, os.path.join(REPO_ROOT, "serve.py"), "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers)],
+        env={**env, "LOG_LEVEL": "WARNING", "DRAIN_TIMEOUT_SECONDS": "5"}, cwd=workdir,
+    )
+    try:
+        app_url = f"http://127.0.0.1:{port}"
+        _wait_for_http(f"{app_url}/health/live", timeout=60.0)
+        load = LoadTest(app_url, args.users, args.concurrency, args.duration, MIXES[args.mix])
+        result = asyncio.run(load.run())
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    latencies = sorted(value for values in load.latencies.values() for value in values)
+    return {
+        "count": result["total_requests"],
+        "errors": sum(s["errors"] for s in result["scenarios"].values()),
+        "rps": result["total_rps"],
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--dsn", help="Scratch Postgres DSN; tables are created if missing")
+    target.add_argument("--docker", action="store_true", help="Start a disposable postgres:17 container")
+    parser.add_argument("--workers", default=f"1,{available_cpus()}", help="Comma separated worker counts")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="reads")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of measured load per configuration")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--llm-delay", type=float, default=0.0, help="Seconds each fake Gemini call takes")
+    parser.add_argument("--out", help="Result path (default benchmarks/results/workers-<commit>.json)")
+    args = parser.parse_args()
+    worker_counts = [int(n) for n in args.workers.split(",")]
+
+    container = None
+    stubs = None
+    workdir = tempfile.TemporaryDirectory()
+    try:
+        dsn = args.dsn
+        if args.docker:
+            container, dsn = _start_postgres_container()
+        stub_port = _free_port()
+        stub_url = f"http://127.0.0.1:{stub_port}"
+        env = _app_environment(dsn, stub_url)
+        stubs = subprocess.Popen(
+            [sys.executable, "-m", "benchmarks.stubs", "--port", str(stub_port), "--llm-delay", str(args.llm_delay)],
+            env=env, cwd=REPO_ROOT,
+        )
+        subprocess.run(
+            [sys.executable, "-c", "from benchmarks.server import create_schema; create_schema()"],
+            env=env, cwd=REPO_ROOT, check=True,
+        )
+        _wait_for_http(f"{stub_url}/docs")
+
+        scenarios = {}
+        for workers in worker_counts:
+            stats = _run_configuration(env, workers, args, workdir.name)
+            scenarios[f"{workers}w"] = stats
+            print(
+                f"{workers:>3} workers  {stats['rps']:9.1f} req/s  p50 {stats['p50_ms']:7.1f}ms  "
+                f"p95 {stats['p95_ms']:7.1f}ms  p99 {stats['p99_ms']:7.1f}ms  errors {stats['errors']}"
+            )
+
+        base = scenarios[f"{worker_counts[0]}w"]["rps"]
+        for name, stats in scenarios.items():
+            stats["speedup"] = stats["rps"] / base if base else 0.0
+        result = {
+            "kind": "workers",
+            "config": {"mix": args.mix, "duration": args.duration, "concurrency": args.concurrency,
+                       "users": args.users, "cpus": available_cpus()},
+            "scenarios": scenarios,
+        }
+        print(f"saved {save_result(result, args.out)}")
+        return 0
+    finally:
+        if stubs:
+            stubs.terminate()
+            stubs.wait(timeout=10)
+        if container:
+            subprocess.run(["docker", "rm", "-f", container], stdout=subprocess.DEVNULL)
+        workdir.cleanup()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Bulk import and export of users and their OAuth accounts.
+
+    python -m commands.bulk_users import users.csv
+    python -m commands.bulk_users import users.ndjson
+    python -m commands.bulk_users export users.csv
+    python -m commands.bulk_users export - --format ndjson | gzip > users.ndjson.gz
+
+Files hold one row per user and OAuth account with the columns email,
+first_name, last_name, avatar_url, is_active, provider, provider_sub,
+provider_email and provider_name; only email is required on import. Rows are
+merged on email (users) and on provider + provider_sub (accounts), so
+re-running an import is safe. An export can be imported again as-is.
+"""
+import argparse
+import sys
+import time
+from core.database import SessionLocal
+from services.bulk_user_service import BulkUserService
+
+
+def _format_for(path: str, explicit: str | None) -> str:
+    if explicit:
+        return explicit
+    return "ndjson" if path.endswith((".ndjson", ".jsonl")) else "csv"
+
+
+def run_import(service: BulkUserService, args) -> None:
+    file_format = _format_for(args.path, args.format)
+    with (sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")) as stream:
+        if file_format == "ndjson":
+            stats = service.import_ndjson(stream)
+        else:
+            stats = service.import_csv(stream)
+    print(", ".join(f"{key}={value}" for key, value in stats.items()), file=sys.stderr)
+
+
+def run_export(service: BulkUserService, args) -> None:
+    file_format = _format_for(args.path, args.format)
+    with (sys.stdout if args.path == "-" else open(args.path, "w", newline="", encoding="utf-8")) as out:
+        service.export(out, format=file_format)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["import", "export"])
+    parser.add_argument("path", help="File to read or write, - for stdin/stdout")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="Default: from the file extension, else csv")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        if args.command == "import":
+            run_import(BulkUserService(db), args)
+        else:
+            run_export(BulkUserService(db), args)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        db.close()
+    print(f"{args.command} finished in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,10 @@
+from functools import cached_property
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Annotated, Any, Literal
 
 from pydantic import (
     AnyUrl,
     BeforeValidator,
-    computed_field,
     PostgresDsn,
     Field
 )
@@ -20,6 +20,14 @@ def parse_cors(v: Any) -> list[str] | str:
     raise ValueError(v)
 
 
+def parse_comma_list(v: Any) -> list[str]:
+    if isinstance(v, str):
+        return [i.strip() for i in v.split(",") if i.strip()]
+    elif isinstance(v, list):
+        return v
+    raise ValueError(v)
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file='.env',
@@ -41,9 +49,20 @@ class Settings(BaseSettings):
     LINKEDIN_EMAIL: str
     LINKEDIN_PASSWORD: str
     FRONTEND_URL: str
+
+    # Provider endpoints, overridable so load tests can point at local stand-ins
+    GOOGLE_TOKEN_URL: str = "https://oauth2.googleapis.com/token"
+    GOOGLE_USERINFO_URL: str = "https://www.googleapis.com/oauth2/v2/userinfo"
+    LINKEDIN_TOKEN_URL: str = "https://www.linkedin.com/oauth/v2/accessToken"
+    LINKEDIN_USERINFO_URL: str = "https://api.linkedin.com/v2/userinfo"
+    GOOGLE_AUTHORIZE_URL: str = "https://accounts.google.com/o/oauth2/v2/auth"
+    LINKEDIN_AUTHORIZE_URL: str = "https://www.linkedin.com/oauth/v2/authorization"
+    GEMINI_BASE_URL: str | None = None
+    # Scheme, host and port the OAuth providers redirect back to; must match
+    # the redirect URIs registered with Google and LinkedIn
+    OAUTH_REDIRECT_BASE: str = "http://127.0.0.1:8000"
     
-    @computed_field
-    @property
+    @cached_property
     def server_host(self) -> str:
         # Use HTTPS for anything other than local development
         if self.ENVIRONMENT == "local":
@@ -54,14 +73,61 @@ class Settings(BaseSettings):
         list[AnyUrl] | str, BeforeValidator(parse_cors)
     ] = Field(default_factory=list)
 
+    LOG_LEVEL: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    # Fraction of requests whose DB, HTTP, PDF and LLM stages are logged as spans
+    TRACE_SAMPLE_RATE: float = Field(default=0.01, ge=0.0, le=1.0)
+
+    # On SIGTERM, in-flight requests and jobs get this long to finish
+    DRAIN_TIMEOUT_SECONDS: int = 25
+    # Threads for blocking work such as resume processing
+    EXECUTOR_MAX_WORKERS: int = 8
+    # Readiness fails while more blocking jobs than this are queued or running
+    EXECUTOR_MAX_PENDING: int = 64
+
+    # Shared secret for operator endpoints such as /api/metrics, sent as
+    # X-Internal-Token; unset keeps them closed
+    INTERNAL_API_TOKEN: str | None = None
+
+    # Responses smaller than this many bytes are sent uncompressed
+    COMPRESSION_MINIMUM_SIZE: int = 1000
+
+    # "postgres" shares rate limit buckets between workers through the database
+    RATE_LIMIT_BACKEND: Literal["memory", "postgres"] = "memory"
+    RESUME_UPLOADS_PER_HOUR: int = 10
+    OAUTH_CALLBACKS_PER_MINUTE: int = 20
+
+    # Tokens issued before access/refresh types existed; turn off once the last
+    # of them expired (ACCESS_TOKEN_EXPIRE_HOURS after the rollout)
+    ACCEPT_UNTYPED_TOKENS: bool = True
+
+    # Summaries of identical CVs / LinkedIn profiles are reused for this long
+    SUMMARY_CACHE_TTL_SECONDS: int = 600
+    # An onboarding summary still unfinished after this long is assumed lost
+    # (e.g. the worker died mid-call) and the next answer generates it again
+    ONBOARDING_SUMMARY_CLAIM_SECONDS: int = 300
+
+    # "hashing" embeds locally without network access (tests, offline use)
+    EMBEDDING_BACKEND: Literal["gemini", "hashing"] = "gemini"
+    # Question banks at least this large are searched with the IVF ANN index
+    QUESTION_ANN_THRESHOLD: int = 50000
+    QUESTION_INDEX_TTL_SECONDS: int = 300
+
+    # Number of server processes; serve.py sets it for every worker it starts
+    WEB_CONCURRENCY: int = 1
+    # Connections all workers together may hold on each Postgres server,
+    # below max_connections (100 by default) to leave room for admin sessions
+    POSTGRES_CONNECTION_BUDGET: int = 90
+    # Per-worker pool overrides; by default the budget is split across workers
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+
     POSTGRESQL_USERNAME: str
     POSTGRESQL_PASSWORD: str
     POSTGRESQL_SERVER: str
     POSTGRESQL_PORT: int
     POSTGRESQL_DATABASE: str
 
-    @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
         return MultiHostUrl.build(
             scheme="postgresql+psycopg2",
@@ -71,3 +137,25 @@ class Settings(BaseSettings):
             port=self.POSTGRESQL_PORT,
             path=self.POSTGRESQL_DATABASE,
         )
+
+    # Comma separated host[:port] list of read replicas, same credentials as the primary
+    POSTGRESQL_REPLICA_HOSTS: Annotated[
+        list[str] | str, BeforeValidator(parse_comma_list)
+    ] = Field(default_factory=list)
+    # After a write, the client reads from the primary for this long
+    READ_YOUR_WRITES_SECONDS: int = 5
+
+    @cached_property
+    def SQLALCHEMY_REPLICA_URIS(self) -> list[PostgresDsn]:
+        uris = []
+        for replica in self.POSTGRESQL_REPLICA_HOSTS:
+            host, _, port = replica.partition(":")
+            uris.append(MultiHostUrl.build(
+                scheme="postgresql+psycopg2",
+                username=self.POSTGRESQL_USERNAME,
+                password=self.POSTGRESQL_PASSWORD,
+                host=host,
+                port=int(port) if port else self.POSTGRESQL_PORT,
+                path=self.POSTGRESQL_DATABASE,
+            ))
+        return uris
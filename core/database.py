@@ -1,18 +1,120 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, DeclarativeBase
+import itertools
+import threading
+import time
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker, DeclarativeBase, Session
 from core.config_loader import settings
+from core.runtime import get_runtime
+from core.tracing import instrument_sqlalchemy
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+
+def pool_limits(budget: int, workers: int) -> tuple[int, int]:
+    """Per-worker ``(pool_size, max_overflow)`` so all workers together stay within ``budget``.
+
+    Two thirds of a worker's share are kept open, the rest is overflow that
+    is only opened under bursts.
+    """
+    per_worker = max(budget // max(workers, 1), 1)
+    pool_size = max(per_worker * 2 // 3, 1)
+    return pool_size, max(per_worker - pool_size, 0)
+
+
+POOL_SIZE, MAX_OVERFLOW = pool_limits(settings.POSTGRES_CONNECTION_BUDGET, settings.WEB_CONCURRENCY)
+if settings.DB_POOL_SIZE is not None:
+    POOL_SIZE = settings.DB_POOL_SIZE
+if settings.DB_MAX_OVERFLOW is not None:
+    MAX_OVERFLOW = settings.DB_MAX_OVERFLOW
+
+engine = create_engine(get_runtime().database_uri, pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW)
+# Each replica is a separate server with its own connection budget
+replica_engines = [
+    create_engine(uri, pool_size=POOL_SIZE, max_overflow=MAX_OVERFLOW, pool_pre_ping=True)
+    for uri in get_runtime().replica_uris
+]
+instrument_sqlalchemy()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Cookie holding the epoch second until which a client reads from the primary
+STICKY_PRIMARY_COOKIE = "db_primary_until"
+
 class Base(DeclarativeBase):
     pass
 
 
-def get_db():
+class ReplicaRouter:
+    """Round-robin over the replica engines, skipping ones that recently failed."""
+
+    def __init__(self, engines: list[Engine], retry_after: float = 30.0):
+        self.engines = engines
+        self.retry_after = retry_after
+        self._counter = itertools.count()
+        self._down_until: dict[Engine, float] = {}
+        self._lock = threading.Lock()
+
+    def candidates(self):
+        if not self.engines:
+            return
+        with self._lock:
+            start = next(self._counter)
+        now = time.monotonic()
+        for offset in range(len(self.engines)):
+            replica = self.engines[(start + offset) % len(self.engines)]
+            if self._down_until.get(replica, 0.0) <= now:
+                yield replica
+
+    def mark_down(self, replica: Engine) -> None:
+        self._down_until[replica] = time.monotonic() + self.retry_after
+
+
+replica_router = ReplicaRouter(replica_engines)
+
+
+@event.listens_for(SessionLocal, "after_flush")
+def _record_write(session, flush_context):
+    session.info["wrote"] = True
+
+
+def _sticky_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(STICKY_PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def get_db(request: Request):
     db = SessionLocal()
     try:
         yield db
     finally:
+        if db.info.get("wrote"):
+            # Picked up by StickyPrimaryMiddleware to pin the client to the primary
+            request.state.db_wrote = True
         db.close()
 
+
+def _open_replica_session() -> Session | None:
+    for replica in replica_router.candidates():
+        db = SessionLocal(bind=replica)
+        db.info["replica"] = True
+        try:
+            db.connection()
+        except OperationalError:
+            db.close()
+            replica_router.mark_down(replica)
+            continue
+        return db
+    return None
+
+
+def get_read_db(request: Request):
+    """Session for read-only handlers: a replica unless the client just wrote."""
+    db = None if _sticky_primary(request) else _open_replica_session()
+    if db is None:
+        db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,32 @@
+import hashlib
+from typing import Optional
+from fastapi import Request, Response
+
+
+def make_etag(body: bytes) -> str:
+    """Weak ETag over the encoded response body, so any field change shows."""
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison, so the W/ prefix is ignored
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(","))
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response when the client already holds ``etag``."""
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def conditional_json(request: Request, body: bytes) -> Response:
+    """Send the JSON ``body`` with its ETag, or a 304 when the client already holds it."""
+    etag = make_etag(body)
+    return not_modified(request, etag) or Response(body, media_type="application/json", headers={"ETag": etag})
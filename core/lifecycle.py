@@ -0,0 +1,140 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Callable, Optional, TypeVar
+import httpx
+from fastapi import FastAPI
+from core.config_loader import settings
+from core.database import engine, replica_engines
+from core.logs import setup_logging
+from core.runtime import install_reload_handler
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class WorkerState:
+    """Shared resources of this worker and its drain bookkeeping.
+
+    ``in_flight`` counts HTTP requests inside the app and ``pending_jobs``
+    the blocking jobs submitted to the executor; both only change on the
+    event loop thread.
+    """
+
+    def __init__(self):
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.executor: Optional[ThreadPoolExecutor] = None
+        self.log_listener = None
+        self.started = False
+        self.draining = False
+        self.in_flight = 0
+        self.pending_jobs = 0
+
+    async def wait_idle(self, deadline: float) -> bool:
+        """Wait until no request or job is running; False if ``deadline`` passed first."""
+        while self.in_flight or self.pending_jobs:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.1)
+        return True
+
+
+worker = WorkerState()
+
+
+@asynccontextmanager
+async def http_client():
+    """The worker's pooled outbound HTTP client, or a throwaway one outside the lifespan."""
+    if worker.http_client is not None:
+        yield worker.http_client
+        return
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+async def run_blocking(func: Callable[..., T], *args, **kwargs) -> T:
+    """Run ``func`` on the worker executor, carrying over request context.
+
+    Jobs are counted so shutdown waits for them, e.g. a resume summary that
+    is still waiting on Gemini.
+    """
+    call = functools.partial(contextvars.copy_context().run, func, *args, **kwargs)
+    if worker.executor is None:
+        return await asyncio.to_thread(call)
+    worker.pending_jobs += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(worker.executor, call)
+    finally:
+        worker.pending_jobs -= 1
+
+
+def _install_drain_handler(loop: asyncio.AbstractEventLoop) -> None:
+    """Put our SIGTERM handler in front of the server's one.
+
+    On SIGTERM the worker starts refusing new requests and reporting not
+    ready, waits for in-flight work up to the drain deadline, and only then
+    hands the signal to the server so it stops.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    previous = signal.getsignal(signal.SIGTERM)
+
+    async def drain(signum, frame):
+        deadline = time.monotonic() + settings.DRAIN_TIMEOUT_SECONDS
+        if not await worker.wait_idle(deadline):
+            logger.warning(
+                "Drain deadline reached",
+                extra={"in_flight": worker.in_flight, "pending_jobs": worker.pending_jobs},
+            )
+        if callable(previous):
+            previous(signum, frame)
+        else:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.raise_signal(signal.SIGTERM)
+
+    def handle_sigterm(signum, frame):
+        if worker.draining:
+            return
+        worker.draining = True
+        logger.info("SIGTERM received, draining", extra={"in_flight": worker.in_flight})
+        loop.call_soon_threadsafe(lambda: loop.create_task(drain(signum, frame)))
+
+    signal.signal(signal.SIGTERM, handle_sigterm)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    worker.log_listener = setup_logging(settings.LOG_LEVEL)
+    worker.executor = ThreadPoolExecutor(max_workers=settings.EXECUTOR_MAX_WORKERS, thread_name_prefix="blocking")
+    worker.http_client = httpx.AsyncClient(timeout=httpx.Timeout(10.0))
+    worker.draining = False
+    _install_drain_handler(asyncio.get_running_loop())
+    install_reload_handler(asyncio.get_running_loop())
+    worker.started = True
+    try:
+        yield
+    finally:
+        # Reverse of startup: stop taking work, finish queued jobs, then
+        # release connections; the log listener goes last so all of the
+        # above can still log
+        worker.started = False
+        worker.draining = True
+        deadline = time.monotonic() + settings.DRAIN_TIMEOUT_SECONDS
+        await worker.wait_idle(deadline)
+        worker.executor.shutdown(wait=False, cancel_futures=True)
+        worker.executor = None
+        await worker.http_client.aclose()
+        worker.http_client = None
+        engine.dispose()
+        for replica in replica_engines:
+            replica.dispose()
+        logger.info("Worker stopped")
+        worker.log_listener.stop()
+        worker.log_listener = None
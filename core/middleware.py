@@ -0,0 +1,201 @@
+import logging
+import re
+import time
+import uuid
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from core.database import STICKY_PRIMARY_COOKIE
+from core.logs import request_id_var
+from core.tracing import start_trace, end_trace
+from core.lifecycle import worker
+
+access_logger = logging.getLogger("app.access")
+
+# Incoming X-Request-ID values are reused only if they look like an id
+_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int = 4) -> None:
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if more_body:
+            # Flush so every streamed chunk can be decoded as it arrives
+            return self.compressor.process(body) + self.compressor.flush()
+        return self.compressor.process(body) + self.compressor.finish()
+
+
+def preferred_encoding(accept_encoding: str) -> str | None:
+    """``"br"``, ``"gzip"`` or None (send as-is) for an Accept-Encoding header.
+
+    Honours q-values, so ``br;q=0`` rules Brotli out; ``*`` stands for any
+    coding not listed and ties go to Brotli.
+    """
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+
+    best, best_weight = None, 0.0
+    for coding in ("br", "gzip"):
+        weight = weights.get(coding, weights.get("*", 0.0))
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+class CompressionMiddleware:
+    """Brotli or gzip response compression, negotiated from Accept-Encoding.
+
+    Bodies smaller than ``minimum_size`` bytes are sent as-is; the small
+    JSON payloads most endpoints return are not worth the CPU.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1000, gzip_level: int = 6, brotli_quality: int = 4) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = preferred_encoding(Headers(scope=scope).get("Accept-Encoding", ""))
+        responder: ASGIApp
+        if encoding == "br":
+            responder = BrotliResponder(self.app, self.minimum_size, quality=self.brotli_quality)
+        elif encoding == "gzip":
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
+
+
+class StickyPrimaryMiddleware:
+    """Pin a client to the primary database for a while after it wrote.
+
+    ``get_db`` flags requests whose session flushed changes; those responses
+    get a cookie that makes ``get_read_db`` skip the replicas until it
+    expires, so the client reads its own writes despite replication lag.
+    """
+
+    def __init__(self, app: ASGIApp, window: int) -> None:
+        self.app = app
+        self.window = window
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = scope.setdefault("state", {})
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.get("db_wrote"):
+                headers = MutableHeaders(scope=message)
+                until = int(time.time()) + self.window
+                headers.append(
+                    "set-cookie",
+                    f"{STICKY_PRIMARY_COOKIE}={until}; Max-Age={self.window}; Path=/; HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+class DrainMiddleware:
+    """Count in-flight requests and refuse new ones once the worker drains.
+
+    Refused requests get a 503 with ``Connection: close`` so clients and the
+    load balancer retry elsewhere. Health probes always pass through.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith("/health"):
+            await self.app(scope, receive, send)
+            return
+
+        if worker.draining:
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": [(b"content-type", b"application/json"), (b"connection", b"close"), (b"retry-after", b"1")],
+            })
+            await send({"type": "http.response.body", "body": b'{"detail":"Server is shutting down"}'})
+            return
+
+        worker.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            worker.in_flight -= 1
+
+
+class RequestContextMiddleware:
+    """Request id, trace sampling and one access log line per request.
+
+    The id comes from ``X-Request-ID`` when the caller sent a sane one and is
+    echoed back in the response; every log record emitted while handling the
+    request carries it.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float = 0.0) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get("x-request-id", "")
+        if not _REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        id_token = request_id_var.set(request_id)
+        trace_token = start_trace(self.sample_rate)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("x-request-id", request_id)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            access_logger.info(
+                "%s %s %s", scope["method"], scope["path"], status_code,
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "status": status_code,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                },
+            )
+            end_trace(trace_token)
+            request_id_var.reset(id_token)
@@ -0,0 +1,156 @@
+import itertools
+import math
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy import text
+from core.config_loader import settings
+from core.database import engine
+from auth.dependencies import get_current_user
+from models.user import User
+
+
+class InMemoryBackend:
+    """Token buckets held in process memory; each worker limits on its own."""
+
+    PRUNE_EVERY = 10_000
+
+    def __init__(self):
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._calls = 0
+
+    def consume(self, key: str, rate: float, capacity: int) -> float:
+        """Take one token from ``key``; return 0 if allowed, else seconds until one is free."""
+        now = time.monotonic()
+        with self._lock:
+            self._calls += 1
+            if self._calls % self.PRUNE_EVERY == 0:
+                self._prune(now)
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens >= 1:
+                self._buckets[key] = (tokens - 1, now)
+                return 0.0
+            self._buckets[key] = (tokens, now)
+            return (1 - tokens) / rate
+
+    def _prune(self, now: float) -> None:
+        # Buckets idle long enough to refill under any limiter are full and
+        # carry no state worth keeping
+        cutoff = now - max_refill_seconds()
+        for key in [k for k, (_, updated) in self._buckets.items() if updated < cutoff]:
+            del self._buckets[key]
+
+
+class PostgresBackend:
+    """Token buckets in the ``rate_limit_buckets`` table, shared by all workers.
+
+    The refill and the decrement happen in one upsert, so the row lock makes
+    concurrent hits on the same key from different workers safe.
+    """
+
+    UPSERT_SQL = text("""
+        INSERT INTO rate_limit_buckets AS b (key, tokens, allowed, updated_at)
+        VALUES (:key, :capacity - 1, true, now())
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM now() - b.updated_at) * :rate)
+                     - CASE WHEN LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM now() - b.updated_at) * :rate) >= 1
+                            THEN 1 ELSE 0 END,
+            allowed = LEAST(:capacity, b.tokens + EXTRACT(EPOCH FROM now() - b.updated_at) * :rate) >= 1,
+            updated_at = now()
+        RETURNING b.tokens, b.allowed
+    """)
+
+    # A missing row behaves like a full bucket, so idle rows can go
+    PRUNE_SQL = text("""
+        DELETE FROM rate_limit_buckets WHERE updated_at < now() - make_interval(secs => :max_idle)
+    """)
+
+    PRUNE_EVERY = 10_000
+
+    def __init__(self):
+        self._calls = itertools.count(1)
+
+    def consume(self, key: str, rate: float, capacity: int) -> float:
+        with engine.begin() as conn:
+            tokens, allowed = conn.execute(
+                self.UPSERT_SQL, {"key": key, "rate": rate, "capacity": capacity}
+            ).one()
+            if next(self._calls) % self.PRUNE_EVERY == 0:
+                conn.execute(self.PRUNE_SQL, {"max_idle": max_refill_seconds()})
+        if allowed:
+            return 0.0
+        return (1 - tokens) / rate
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = PostgresBackend() if settings.RATE_LIMIT_BACKEND == "postgres" else InMemoryBackend()
+    return _backend
+
+
+rate_limiters: Dict[str, "RateLimiter"] = {}
+
+
+class RateLimiter:
+    """Token-bucket limit of ``limit`` requests per ``period`` seconds.
+
+    Use one of the bound methods as a route dependency, e.g.
+    ``dependencies=[Depends(limiter.by_user)]``. Rejected requests get a 429
+    with a ``Retry-After`` header.
+    """
+
+    def __init__(self, name: str, limit: int, period: float):
+        self.name = name
+        self.capacity = limit
+        self.rate = limit / period
+        self.allowed = 0
+        self.limited = 0
+        # Sync dependencies run on threadpool threads
+        self._lock = threading.Lock()
+        rate_limiters[name] = self
+
+    def hit(self, key: str) -> None:
+        retry_after = get_backend().consume(f"{self.name}:{key}", self.rate, self.capacity)
+        with self._lock:
+            if not retry_after:
+                self.allowed += 1
+            else:
+                self.limited += 1
+        if not retry_after:
+            return
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many requests",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    def by_user(self, current_user: User = Depends(get_current_user)) -> None:
+        self.hit(f"user:{current_user.id}")
+
+    def by_ip(self, request: Request) -> None:
+        self.hit(f"ip:{client_ip(request)}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"limit": self.capacity, "per_second": self.rate, "allowed": self.allowed, "limited": self.limited}
+
+
+def client_ip(request: Request) -> Optional[str]:
+    # Behind a proxy, run uvicorn with --proxy-headers so this is the real client
+    return request.client.host if request.client else None
+
+
+def max_refill_seconds() -> float:
+    """Longest time any limiter's bucket takes to refill from empty."""
+    return max((limiter.capacity / limiter.rate for limiter in rate_limiters.values()), default=0.0)
+
+
+def rate_limit_stats() -> dict:
+    return {name: limiter.stats() for name, limiter in rate_limiters.items()}
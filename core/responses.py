@@ -0,0 +1,11 @@
+from typing import Any, Sequence
+from pydantic import TypeAdapter
+
+
+def encode_list(adapter: TypeAdapter, rows: Sequence[Any]) -> bytes:
+    """Validate ORM rows with ``adapter`` and encode them straight to JSON bytes.
+
+    Skips FastAPI's ``jsonable_encoder`` dict pass, which dominates the cost
+    of large list responses.
+    """
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
@@ -0,0 +1,130 @@
+import asyncio
+import logging
+import signal
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+from urllib.parse import urlencode
+from core.config import Settings
+from core.config_loader import settings
+
+logger = logging.getLogger(__name__)
+
+# Where main.py mounts the OAuth router
+OAUTH_CALLBACK_PATH = "/api/auth/{provider}/callback"
+
+
+@dataclass(frozen=True, slots=True)
+class OAuthProvider:
+    name: str
+    client_id: str
+    client_secret: str
+    redirect_uri: str
+    # Full login redirect, query string included
+    authorize_url: str
+    token_url: str
+    userinfo_url: str
+    scope: str
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """Values derived from ``Settings``, computed once so request paths only read attributes."""
+
+    settings: Settings
+    database_uri: str
+    replica_uris: tuple[str, ...]
+    cors_origins: tuple[str, ...]
+    oauth_providers: Mapping[str, OAuthProvider]
+    oauth_success_url: str
+
+    @classmethod
+    def build(cls, settings: Settings) -> "RuntimeConfig":
+        providers = {
+            "google": _provider(
+                "google", settings.GOOGLE_CLIENT_ID, settings.GOOGLE_CLIENT_SECRET, settings.OAUTH_REDIRECT_BASE,
+                settings.GOOGLE_AUTHORIZE_URL, settings.GOOGLE_TOKEN_URL, settings.GOOGLE_USERINFO_URL,
+                scope="openid email profile", extra={"access_type": "offline", "prompt": "consent"},
+            ),
+            "linkedin": _provider(
+                "linkedin", settings.LINKEDIN_CLIENT_ID, settings.LINKEDIN_CLIENT_SECRET, settings.OAUTH_REDIRECT_BASE,
+                settings.LINKEDIN_AUTHORIZE_URL, settings.LINKEDIN_TOKEN_URL, settings.LINKEDIN_USERINFO_URL,
+                scope="openid profile email",
+            ),
+        }
+        return cls(
+            settings=settings,
+            database_uri=str(settings.SQLALCHEMY_DATABASE_URI),
+            replica_uris=tuple(str(uri) for uri in settings.SQLALCHEMY_REPLICA_URIS),
+            cors_origins=tuple(str(origin).strip("/") for origin in settings.BACKEND_CORS_ORIGINS),
+            oauth_providers=MappingProxyType(providers),
+            oauth_success_url=f"{settings.FRONTEND_URL}/oauth-success",
+        )
+
+
+def _provider(name, client_id, client_secret, redirect_base, authorize_base, token_url, userinfo_url,
+              scope, extra=None) -> OAuthProvider:
+    redirect_uri = f"{redirect_base.rstrip('/')}{OAUTH_CALLBACK_PATH.format(provider=name)}"
+    params = {
+        "response_type": "code",
+        "client_id": client_id,
+        "redirect_uri": redirect_uri,
+        "scope": scope,
+        **(extra or {}),
+    }
+    return OAuthProvider(
+        name=name,
+        client_id=client_id,
+        client_secret=client_secret,
+        redirect_uri=redirect_uri,
+        authorize_url=f"{authorize_base}?{urlencode(params)}",
+        token_url=token_url,
+        userinfo_url=userinfo_url,
+        scope=scope,
+    )
+
+
+_runtime = RuntimeConfig.build(settings)
+
+
+def get_runtime() -> RuntimeConfig:
+    return _runtime
+
+
+def reload_runtime() -> RuntimeConfig:
+    """Re-read the environment and ``.env`` and swap in a new runtime config.
+
+    Only values read through ``get_runtime()`` change: OAuth clients,
+    redirects and endpoints and the frontend URL. Database URLs, pools, CORS
+    and everything read from ``settings`` at import keep their startup values
+    until the worker restarts.
+    """
+    global _runtime
+    new = RuntimeConfig.build(Settings())
+    if new.database_uri != _runtime.database_uri or new.replica_uris != _runtime.replica_uris:
+        logger.warning("Database settings changed; they apply after a restart")
+    if new.cors_origins != _runtime.cors_origins:
+        logger.warning("CORS origins changed; they apply after a restart")
+    _runtime = new
+    logger.info("Runtime config reloaded")
+    return new
+
+
+def install_reload_handler(loop: asyncio.AbstractEventLoop) -> None:
+    """Reload the runtime config when this worker receives SIGHUP.
+
+    Under ``serve.py`` the supervisor process restarts its workers on SIGHUP
+    instead; send the signal to a worker to reload it in place.
+    """
+    if not hasattr(signal, "SIGHUP") or threading.current_thread() is not threading.main_thread():
+        return
+
+    def reload():
+        try:
+            reload_runtime()
+        except Exception:
+            # A broken .env must not take the worker down; keep the old config
+            logger.exception("Runtime config reload failed")
+
+    signal.signal(signal.SIGHUP, lambda signum, frame: loop.call_soon_threadsafe(reload))
@@ -1,4 +1,5 @@
 from cryptography.fernet import Fernet
+from functools import lru_cache
 import base64
 from core.config_loader import settings
 
@@ -6,14 +7,18 @@ def get_fernet_key() -> bytes:
     key = base64.urlsafe_b64encode(settings.SECRET_KEY[:32].encode().ljust(32, b'0'))
     return key
 
+@lru_cache(maxsize=1)
+def get_fernet() -> Fernet:
+    return Fernet(get_fernet_key())
+
 def encrypt_token(token: str) -> str:
     if not token:
         return None
-    fernet = Fernet(get_fernet_key())
+    fernet = get_fernet()
     return fernet.encrypt(token.encode()).decode()
 
 def decrypt_token(encrypted_token: str) -> str:
     if not encrypted_token:
         return None
-    fernet = Fernet(get_fernet_key())
+    fernet = get_fernet()
     return fernet.decrypt(encrypted_token.encode()).decode()
\ No newline at end of file
@@ -0,0 +1,75 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("app.trace")
+
+# Whether the current request was picked for tracing; spans are free otherwise
+_sampled: ContextVar[bool] = ContextVar("trace_sampled", default=False)
+
+
+def start_trace(sample_rate: float):
+    """Decide whether the current request is traced; returns a reset token."""
+    return _sampled.set(sample_rate > 0 and random.random() < sample_rate)
+
+
+def end_trace(token) -> None:
+    _sampled.reset(token)
+
+
+def is_sampled() -> bool:
+    return _sampled.get()
+
+
+def _emit(name: str, started: float, error: bool, attrs: dict) -> None:
+    duration_ms = round((time.perf_counter() - started) * 1000, 3)
+    logger.info(name, extra={"span": name, "duration_ms": duration_ms, "error": error, **attrs})
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """Time the enclosed block and log it as a span when the request is sampled.
+
+    Works around both sync and ``await`` code, since the sampling decision
+    lives in a context variable.
+    """
+    if not _sampled.get():
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        _emit(name, started, True, attrs)
+        raise
+    _emit(name, started, False, attrs)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _sampled.get():
+        conn.info.setdefault("trace_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.get("trace_started")
+    if started:
+        # Statement text only; parameters may hold tokens or personal data
+        _emit("db.query", started.pop(), False, {"statement": statement[:200]})
+
+
+def _handle_error(exception_context):
+    started = exception_context.connection.info.get("trace_started") if exception_context.connection else None
+    if started:
+        _emit("db.query", started.pop(), True, {"statement": (exception_context.statement or "")[:200]})
+
+
+def instrument_sqlalchemy() -> None:
+    """Emit a ``db.query`` span for every statement of a sampled request."""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(Engine, "handle_error", _handle_error)
@@ -1,10 +1,18 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from core.config_loader import settings
+from core.middleware import CompressionMiddleware, StickyPrimaryMiddleware, RequestContextMiddleware, DrainMiddleware
+from core.lifecycle import lifespan
+from core.runtime import get_runtime
 
 from routes.oauth import router as oauth_router
 from routes.user import router as user_router
 from routes.resume import router as resume_router
+from routes.metrics import router as metrics_router
+from routes.question import router as question_router
+from routes.onboarding import router as onboarding_router
+from routes.health import router as health_router
 
 openapi_tags = [
     {
@@ -21,24 +29,28 @@ openapi_tags = [
     }
 ]
 
-app = FastAPI(openapi_tags=openapi_tags)
+app = FastAPI(openapi_tags=openapi_tags, default_response_class=ORJSONResponse, lifespan=lifespan)
 
-if settings.BACKEND_CORS_ORIGINS:
+if get_runtime().cors_origins:
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            str(origin).strip("/") for origin in settings.BACKEND_CORS_ORIGINS
-        ],
+        allow_origins=list(get_runtime().cors_origins),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+app.add_middleware(StickyPrimaryMiddleware, window=settings.READ_YOUR_WRITES_SECONDS)
+app.add_middleware(DrainMiddleware)
+# Outermost, so the request id and trace sampling cover every other layer
+app.add_middleware(RequestContextMiddleware, sample_rate=settings.TRACE_SAMPLE_RATE)
+
 app.include_router(oauth_router, prefix='/api')
 app.include_router(user_router, prefix='/api')
 app.include_router(resume_router, prefix='/api')
-
-@app.get("/health", tags=['Health Checks'])
-def read_root():
-    return {"health": "true"}
+app.include_router(question_router, prefix='/api')
+app.include_router(onboarding_router, prefix='/api')
+app.include_router(metrics_router, prefix='/api')
+app.include_router(health_router)
 
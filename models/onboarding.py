@@ -0,0 +1,38 @@
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, DateTime, ForeignKey, Text, Integer
+from sqlalchemy.dialects.postgresql import UUID
+from core.database import Base
+from datetime import datetime, timezone
+from typing import Optional, List
+import uuid
+
+class OnboardingSummary(Base):
+    __tablename__ = 'onboarding_summary'
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, unique=True)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="in_progress")
+    welcome_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now(timezone.utc))
+    completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Set with status "summarizing"; an old claim can be taken over
+    summary_claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    user: Mapped["User"] = relationship("User", back_populates="onboarding_summary", uselist=False)
+    turns: Mapped[List["OnboardingTurn"]] = relationship(
+        "OnboardingTurn", back_populates="onboarding", order_by="OnboardingTurn.position", lazy="selectin"
+    )
+
+class OnboardingTurn(Base):
+    __tablename__ = 'onboarding_turns'
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    onboarding_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey('onboarding_summary.id'), nullable=False, index=True)
+    step: Mapped[str] = mapped_column(String(50), nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    question: Mapped[str] = mapped_column(Text, nullable=False)
+    answer: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    answered_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    onboarding: Mapped["OnboardingSummary"] = relationship("OnboardingSummary", back_populates="turns")
@@ -0,0 +1,18 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, DateTime, Text, LargeBinary
+from sqlalchemy.dialects.postgresql import UUID
+from core.database import Base
+from datetime import datetime, timezone
+from typing import Optional
+import uuid
+
+class Question(Base):
+    __tablename__ = 'questions'
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    topic: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+    # float32 vector as raw bytes, produced by the embedding function named in embedding_model
+    embedding: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    embedding_model: Mapped[str] = mapped_column(String(100), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now(timezone.utc))
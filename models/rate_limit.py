@@ -0,0 +1,13 @@
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, Float, Boolean, DateTime
+from core.database import Base
+from datetime import datetime
+
+class RateLimitBucket(Base):
+    """Shared token bucket state, written by core.rate_limit.PostgresBackend"""
+    __tablename__ = 'rate_limit_buckets'
+
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    tokens: Mapped[float] = mapped_column(Float, nullable=False)
+    allowed: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
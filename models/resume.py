@@ -1,6 +1,6 @@
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, DateTime, ForeignKey, Text 
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import String, DateTime, ForeignKey, Text, Integer, Computed, Index
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from core.database import Base 
 from datetime import datetime, timezone
 from typing import Optional 
@@ -15,5 +15,15 @@ class Resume(Base):
     linkedin_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     uploaded_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.now(timezone.utc))
+    # Bumped on every write; an upload only saves over the version it read
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
+    # Maintained by Postgres for full-text search, never loaded with the row
+    summary_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR, Computed("to_tsvector('english', coalesce(summary, ''))", persisted=True), deferred=True
+    )
     
-    user: Mapped["User"] = relationship("User", back_populates="resume_upload", uselist=False)
\ No newline at end of file
+    user: Mapped["User"] = relationship("User", back_populates="resume_upload", uselist=False)
+
+    __table_args__ = (
+        Index('ix_resume_summary_tsv', 'summary_tsv', postgresql_using='gin'),
+    )
\ No newline at end of file
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from typing import Optional, List
 import uuid
 from models.resume import Resume
+from models.onboarding import OnboardingSummary
 
 class User(Base):
     __tablename__ = 'users'
@@ -22,6 +23,6 @@ class User(Base):
     # user_summary
     oauth_accounts: Mapped[List["OAuthAccount"]] = relationship("OAuthAccount", back_populates="user")
     resume_upload: Mapped[Optional["Resume"]] = relationship("Resume", back_populates="user", uselist=False)
-    # onboarding_summary: Mapped[Optional["OnboardingSummary"]] = relationship("OnboardingSummary", back_populates="user", uselist=False)
+    onboarding_summary: Mapped[Optional["OnboardingSummary"]] = relationship("OnboardingSummary", back_populates="user", uselist=False)
 
 
@@ -0,0 +1,54 @@
+from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from core.config_loader import settings
+from core.database import engine, MAX_OVERFLOW
+from core.lifecycle import worker
+
+router = APIRouter(prefix="/health", tags=["Health Checks"])
+
+def _pool_status() -> dict:
+    pool = engine.pool
+    return {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": pool.overflow(),
+        # No idle connection and no room to open one: a ping would just queue
+        "saturated": pool.checkedin() == 0 and pool.overflow() >= MAX_OVERFLOW,
+    }
+
+def _database_reachable() -> bool:
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        return True
+    except SQLAlchemyError:
+        return False
+
+@router.get("/live", summary="Liveness: the worker is running and serving requests")
+async def liveness():
+    return {"status": "alive"}
+
+@router.get("/ready", summary="Readiness: the worker should receive traffic")
+def readiness():
+    pool = _pool_status()
+    jobs = {"pending": worker.pending_jobs, "max_pending": settings.EXECUTOR_MAX_PENDING}
+    log_queue = worker.log_listener.queue.qsize() if worker.log_listener else 0
+    checks = {
+        "started": worker.started,
+        "draining": worker.draining,
+        "database": not pool["saturated"] and _database_reachable(),
+        "jobs": worker.pending_jobs <= settings.EXECUTOR_MAX_PENDING,
+    }
+    ready = checks["started"] and not checks["draining"] and checks["database"] and checks["jobs"]
+    body = {
+        "status": "ready" if ready else "not_ready",
+        "checks": checks,
+        "pool": pool,
+        "jobs": jobs,
+        "in_flight": worker.in_flight,
+        "log_queue": log_queue,
+    }
+    return ORJSONResponse(body, status_code=200 if ready else 503)
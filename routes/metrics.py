@@ -0,0 +1,11 @@
+from fastapi import APIRouter, Depends
+from auth.dependencies import require_internal
+from core.rate_limit import rate_limit_stats
+from utils.singleflight import singleflight_stats
+
+router = APIRouter(prefix="/metrics", tags=["Health Checks"], dependencies=[Depends(require_internal)])
+
+@router.get("/")
+def get_metrics():
+    """In-process counters of this worker"""
+    return {"rate_limits": rate_limit_stats(), "singleflight": singleflight_stats()}
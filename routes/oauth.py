@@ -1,55 +1,58 @@
+import logging
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import RedirectResponse
 from sqlalchemy.orm import Session
-from urllib.parse import urlencode
 from core.database import get_db
 from core.config_loader import settings
-from auth.oauth import oauth_login
+from core.runtime import get_runtime
+from auth.oauth import oauth_login, refresh_tokens
+from schemas.oauth import RefreshRequest, TokenResponse
+from core.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["OAuth"])
 
+# Callbacks hit the providers, so throttle them per client IP
+callback_limiter = RateLimiter("oauth_callback", settings.OAUTH_CALLBACKS_PER_MINUTE, 60)
+
 @router.get("/google/login")
 async def google_login():
-    params = {
-        "client_id": settings.GOOGLE_CLIENT_ID,
-        "redirect_uri": "http://127.0.0.1:8000/api/auth/google/callback",
-        "scope": "openid email profile",
-        "response_type": "code",
-        "access_type": "offline",
-        "prompt": "consent"
-    }
-    url = f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
-    return RedirectResponse(url)
-
-@router.get("/google/callback")
+    return RedirectResponse(get_runtime().oauth_providers["google"].authorize_url)
+
+@router.get("/google/callback", dependencies=[Depends(callback_limiter.by_ip)])
 async def google_callback(code: str, state: str = None, db: Session = Depends(get_db)):
     if not code:
         raise HTTPException(status_code=400, detail="Authorization code not provided")
     try:
         tokens = await oauth_login("google", code, db)
-        frontend_url = f"{settings.FRONTEND_URL}/oauth-success?access_token={tokens['access_token']}&refresh_token={tokens['refresh_token']}"
+        frontend_url = f"{get_runtime().oauth_success_url}?access_token={tokens['access_token']}&refresh_token={tokens['refresh_token']}"
         return RedirectResponse(frontend_url)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("OAuth callback failed", extra={"provider": "google"})
+        raise HTTPException(status_code=400, detail="OAuth login failed")
 
 @router.get("/linkedin/login")
 async def linkedin_login():
-    params = {
-        "response_type": "code",
-        "client_id": settings.LINKEDIN_CLIENT_ID,
-        "redirect_uri": "http://127.0.0.1:8000/api/auth/linkedin/callback",
-        "scope": "openid profile email"
-    }
-    url = f"https://www.linkedin.com/oauth/v2/authorization?{urlencode(params)}"
-    return RedirectResponse(url)
-
-@router.get("/linkedin/callback")
+    return RedirectResponse(get_runtime().oauth_providers["linkedin"].authorize_url)
+
+@router.get("/linkedin/callback", dependencies=[Depends(callback_limiter.by_ip)])
 async def linkedin_callback(code: str, state: str = None, db: Session = Depends(get_db)):
     if not code:
         raise HTTPException(status_code=400, detail="Authorization code not provided")
     try:
         tokens = await oauth_login("linkedin", code, db)
-        frontend_url = f"{settings.FRONTEND_URL}/oauth-success?access_token={tokens['access_token']}&refresh_token={tokens['refresh_token']}"
+        frontend_url = f"{get_runtime().oauth_success_url}?access_token={tokens['access_token']}&refresh_token={tokens['refresh_token']}"
         return RedirectResponse(frontend_url)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        raise
+    except Exception:
+        logger.exception("OAuth callback failed", extra={"provider": "linkedin"})
+        raise HTTPException(status_code=400, detail="OAuth login failed")
+
+@router.post("/refresh", response_model=TokenResponse)
+def refresh(body: RefreshRequest, db: Session = Depends(get_db)):
+    """Exchange a refresh token for a new access/refresh token pair"""
+    return refresh_tokens(body.refresh_token, db)
@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+import uuid
+from auth.dependencies import get_current_user
+from models.user import User
+from core.database import get_db
+from schemas.onboarding import OnboardingResponse, OnboardingAnswer
+from services.onboarding_service import get_onboarding, start_onboarding, answer_turn
+
+router = APIRouter(prefix="/onboarding", tags=["Onboarding"])
+
+@router.get("/", response_model=OnboardingResponse, summary="Get the current user's onboarding conversation")
+def read_onboarding(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    onboarding = get_onboarding(db, current_user.id)
+    if onboarding is None:
+        raise HTTPException(status_code=404, detail="Onboarding has not been started")
+    return onboarding
+
+@router.post("/start", response_model=OnboardingResponse, summary="Start onboarding, or return the one already in progress")
+async def start(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    return await start_onboarding(db, current_user.id)
+
+@router.post("/turns/{turn_id}/answer", response_model=OnboardingResponse, summary="Answer an onboarding question")
+async def answer(
+    turn_id: uuid.UUID,
+    payload: OnboardingAnswer,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    return await answer_turn(db, current_user.id, turn_id, payload.answer)
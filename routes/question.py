@@ -0,0 +1,34 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from auth.dependencies import get_current_user, require_internal
+from core.database import get_db, get_read_db
+from models.user import User
+from schemas.question import QuestionBulkCreate, QuestionResponse, QuestionSearchHit
+from services.question_service import QuestionBank, get_question_bank
+
+router = APIRouter(prefix="/questions", tags=["Questions"])
+
+@router.post(
+    "/",
+    response_model=List[QuestionResponse],
+    summary="Add questions to the interview question bank",
+    dependencies=[Depends(require_internal)],
+)
+def add_questions(
+    body: QuestionBulkCreate,
+    db: Session = Depends(get_db),
+    bank: QuestionBank = Depends(get_question_bank)
+):
+    return bank.add_questions(db, body.questions)
+
+@router.get("/search", response_model=List[QuestionSearchHit], summary="Find the questions closest to a topic or answer")
+def search_questions(
+    q: str = Query(..., min_length=2, max_length=2000),
+    k: int = Query(5, ge=1, le=50),
+    topic: Optional[str] = Query(None, max_length=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+    bank: QuestionBank = Depends(get_question_bank)
+):
+    return [{"question": question, "score": score} for question, score in bank.search(db, q, k=k, topic=topic)]
@@ -1,15 +1,23 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Request, Query
 from sqlalchemy.orm import Session
 from typing import Optional, List
 from auth.dependencies import get_current_user
 from models.user import User
 from models.resume import Resume
-from services.resume_service import process_and_save_resume
-from core.database import get_db
+from services.resume_service import process_and_save_resume, search_resumes
+from core.database import get_db, get_read_db
+from core.config_loader import settings
+from core.rate_limit import RateLimiter
+from core.responses import encode_list
+from core.http_cache import conditional_json
+from core.lifecycle import run_blocking
+from schemas.resume import ResumeResponse, ResumeListAdapter, ResumeSearchHit
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 
-@router.post("/", summary="Upload a resume/CV or provide LinkedIn profile for the current user")
+upload_limiter = RateLimiter("resume_upload", settings.RESUME_UPLOADS_PER_HOUR, 3600)
+
+@router.post("/", summary="Upload a resume/CV or provide LinkedIn profile for the current user", dependencies=[Depends(upload_limiter.by_user)])
 async def upload_resume(
     cv: Optional[UploadFile] = File(None),
     linkedin_profile: Optional[str] = Form(None),
@@ -18,7 +26,8 @@ async def upload_resume(
 ):
     if not cv and not linkedin_profile:
         raise HTTPException(status_code=400, detail="Either a resume file or LinkedIn profile must be provided.")
-    resume = process_and_save_resume(db, str(current_user.id), cv, linkedin_profile)
+    # PDF parsing, scraping and Gemini all block, keep them off the event loop
+    resume = await run_blocking(process_and_save_resume, db, str(current_user.id), cv, linkedin_profile)
     return {
         "id": str(resume.id),
         "resume_path": resume.resume_path,
@@ -27,17 +36,18 @@ async def upload_resume(
         "uploaded_at": resume.uploaded_at,
     }
 
-@router.get("/", response_model=List[dict], summary="List all resumes with their saved data")
-def list_resumes(db: Session = Depends(get_db)):
+@router.get("/", response_model=List[ResumeResponse], summary="List all resumes with their saved data")
+def list_resumes(request: Request, db: Session = Depends(get_read_db)):
     resumes = db.query(Resume).all()
-    return [
-        {
-            "id": str(r.id),
-            "user_id": str(r.user_id),
-            "resume_path": r.resume_path,
-            "linkedin_url": r.linkedin_url,
-            "summary": r.summary,
-            "uploaded_at": r.uploaded_at,
-        }
-        for r in resumes
-    ] 
\ No newline at end of file
+    return conditional_json(request, encode_list(ResumeListAdapter, resumes))
+
+@router.get("/search", response_model=List[ResumeSearchHit], summary="Search resume summaries by skill or keyword")
+def search(
+    q: str = Query(..., min_length=2, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db)
+):
+    hits = search_resumes(db, q, skip=skip, limit=limit)
+    return [{"resume": resume, "rank": rank} for resume, rank in hits]
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Request
 from sqlalchemy.orm import Session
 from typing import List
-from core.database import get_db
+from core.database import get_db, get_read_db
 from auth.dependencies import get_current_user
 from models.user import User
-from schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse, ResumeUploadCreate, ResumeUploadResponse
+from schemas.user import UserCreate, UserUpdate, UserResponse, UserListResponse, UserListAdapter, UserBatchRequest, UserBatchItem, ResumeUploadCreate, ResumeUploadResponse
+from core.responses import encode_list
+from core.http_cache import conditional_json
 from services.user_service import UserService
+from services.user_loader import UserLoader, get_user_loader
 from datetime import datetime, timezone
 import uuid
 
@@ -13,10 +16,11 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user_profile(
+    request: Request,
     current_user: User = Depends(get_current_user)
 ):
     """Get current user's profile"""
-    return current_user
+    return conditional_json(request, UserResponse.model_validate(current_user).model_dump_json().encode())
 
 @router.put("/me", response_model=UserResponse)
 async def update_current_user_profile(
@@ -63,25 +67,39 @@ async def read_cv(
 
 @router.get("/", response_model=List[UserListResponse])
 async def get_users(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_user)
 ):
     """Get list of users (paginated)"""
     user_service = UserService(db)
     users = user_service.get_users(skip=skip, limit=limit)
-    return users
+    return conditional_json(request, encode_list(UserListAdapter, users))
+
+@router.post("/batch", response_model=List[UserBatchItem])
+async def get_users_batch(
+    batch: UserBatchRequest,
+    db: Session = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Get several users by ID in one query, in request order"""
+    user_service = UserService(db)
+    users = user_service.get_users_by_ids(batch.ids)
+    return [
+        UserBatchItem(id=user_id, found=user is not None, user=user)
+        for user_id, user in zip(batch.ids, users)
+    ]
 
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user_by_id(
-    user_id: int,
-    db: Session = Depends(get_db),
+    user_id: uuid.UUID,
+    loader: UserLoader = Depends(get_user_loader),
     current_user: User = Depends(get_current_user)
 ):
-    """Get user by ID"""
-    user_service = UserService(db)
-    user = user_service.get_user_by_id(user_id)
+    """Get user by ID; concurrent lookups share one query"""
+    user = await loader.load(user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
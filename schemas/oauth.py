@@ -6,3 +6,11 @@ class OAuthUserInfo(BaseModel):
     first_name: str
     provider_sub: str
     provider: OAuthProviderEnum
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+class TokenResponse(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
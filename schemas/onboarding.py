@@ -0,0 +1,30 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+import uuid
+
+class OnboardingTurnResponse(BaseModel):
+    id: uuid.UUID
+    step: str
+    position: int
+    question: str
+    answer: Optional[str] = None
+    answered_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class OnboardingResponse(BaseModel):
+    id: uuid.UUID
+    status: str
+    welcome_message: Optional[str] = None
+    summary: Optional[str] = None
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+    turns: List[OnboardingTurnResponse] = []
+
+    class Config:
+        from_attributes = True
+
+class OnboardingAnswer(BaseModel):
+    answer: str = Field(..., min_length=1, max_length=4000)
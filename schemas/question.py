@@ -0,0 +1,24 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+import uuid
+
+MAX_QUESTIONS_PER_REQUEST = 500
+
+class QuestionCreate(BaseModel):
+    text: str = Field(..., min_length=1, max_length=2000)
+    topic: Optional[str] = Field(None, max_length=100)
+
+class QuestionBulkCreate(BaseModel):
+    questions: List[QuestionCreate] = Field(..., min_length=1, max_length=MAX_QUESTIONS_PER_REQUEST)
+
+class QuestionResponse(BaseModel):
+    id: uuid.UUID
+    text: str
+    topic: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class QuestionSearchHit(BaseModel):
+    question: QuestionResponse
+    score: float
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, TypeAdapter
+from typing import List, Optional
+from datetime import datetime
+import uuid
+
+class ResumeResponse(BaseModel):
+    id: uuid.UUID
+    user_id: uuid.UUID
+    resume_path: Optional[str] = None
+    linkedin_url: Optional[str] = None
+    summary: Optional[str] = None
+    uploaded_at: datetime
+
+    class Config:
+        from_attributes = True
+
+ResumeListAdapter = TypeAdapter(List[ResumeResponse])
+
+class ResumeSearchHit(BaseModel):
+    resume: ResumeResponse
+    rank: float
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 import uuid
 
@@ -39,6 +39,18 @@ class UserListResponse(BaseModel):
     class Config:
         from_attributes = True
 
+UserListAdapter = TypeAdapter(List[UserListResponse])
+
+MAX_BATCH_USERS = 100
+
+class UserBatchRequest(BaseModel):
+    ids: List[uuid.UUID] = Field(..., min_length=1, max_length=MAX_BATCH_USERS)
+
+class UserBatchItem(BaseModel):
+    id: uuid.UUID
+    found: bool
+    user: Optional[UserResponse] = None
+
 class ResumeUploadCreate(BaseModel):
     file_path: str
 
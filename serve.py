@@ -0,0 +1,88 @@
+"""Production entry point: ``main:app`` under uvicorn's multi-process supervisor.
+
+    python serve.py --port 8000
+    python serve.py --workers 4 --keep-alive 75
+
+The worker count defaults to the CPUs this process may use (affinity and
+cgroup quota aware) and is exported as ``WEB_CONCURRENCY`` so every worker
+sizes its database pool to its share of ``POSTGRES_CONNECTION_BUDGET``.
+"""
+import argparse
+import importlib.util
+import math
+import os
+import sys
+
+import uvicorn
+
+
+def available_cpus() -> int:
+    """CPUs this process can actually run on, including container CPU limits."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        # cgroup v2: "<quota> <period>" or "max <period>"
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            cpus = min(cpus, max(math.ceil(int(quota) / int(period)), 1))
+    except (OSError, ValueError):
+        pass
+    return cpus
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, help="Worker processes (default: WEB_CONCURRENCY or one per CPU)")
+    parser.add_argument("--backlog", type=int, default=2048, help="Pending connections the listen socket queues")
+    parser.add_argument(
+        "--keep-alive", type=int, default=65,
+        help="Idle keep-alive seconds; keep it above the load balancer's idle timeout to avoid 502s",
+    )
+    parser.add_argument("--forwarded-allow-ips", default="127.0.0.1", help="Proxies trusted for X-Forwarded-*")
+    args = parser.parse_args()
+
+    workers = args.workers or int(os.environ.get("WEB_CONCURRENCY") or available_cpus())
+    # Inherited by the worker processes, read by core.database to size the pools
+    os.environ["WEB_CONCURRENCY"] = str(workers)
+
+    from core.config_loader import settings
+    from core.database import POOL_SIZE, MAX_OVERFLOW
+
+    connections = workers * (POOL_SIZE + MAX_OVERFLOW)
+    if connections > settings.POSTGRES_CONNECTION_BUDGET:
+        print(
+            f"{workers} workers x {POOL_SIZE + MAX_OVERFLOW} connections exceeds "
+            f"POSTGRES_CONNECTION_BUDGET={settings.POSTGRES_CONNECTION_BUDGET}",
+            file=sys.stderr,
+        )
+        return 2
+    print(f"starting {workers} workers, db pool {POOL_SIZE}+{MAX_OVERFLOW} each ({connections} max)", file=sys.stderr)
+
+    uvicorn.run(
+        "main:app",
+        host=args.host,
+        port=args.port,
+        workers=workers,
+        # uvloop has no Windows build; fall back to the stdlib loop there
+        loop="uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        http="httptools",
+        backlog=args.backlog,
+        timeout_keep_alive=args.keep_alive,
+        # Draining happens before the server is told to stop, see core.lifecycle
+        timeout_graceful_shutdown=settings.DRAIN_TIMEOUT_SECONDS,
+        proxy_headers=True,
+        forwarded_allow_ips=args.forwarded_allow_ips,
+        # The app logs requests itself; uvicorn's loggers propagate to its JSON handler
+        access_log=False,
+        log_config=None,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
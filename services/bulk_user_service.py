@@ -0,0 +1,246 @@
+import csv
+import io
+import json
+from typing import IO, Iterable, Iterator
+from sqlalchemy.orm import Session
+from models.oauth import OAuthProviderEnum
+
+# Columns accepted on import and written on export, one row per user and OAuth account
+USER_COLUMNS = (
+    "email",
+    "first_name",
+    "last_name",
+    "avatar_url",
+    "is_active",
+    "provider",
+    "provider_sub",
+    "provider_email",
+    "provider_name",
+)
+
+PROVIDERS = tuple(p.value for p in OAuthProviderEnum)
+
+STAGING_DDL = """
+CREATE TEMP TABLE user_import (
+    seq bigserial,
+    email text,
+    first_name text,
+    last_name text,
+    avatar_url text,
+    is_active boolean,
+    provider text,
+    provider_sub text,
+    provider_email text,
+    provider_name text
+) ON COMMIT DROP
+"""
+
+# Rows left out of the merge, wholly or (bad OAuth fields) just their account
+INVALID_ROWS_SQL = """
+SELECT count(*) FROM user_import
+WHERE email IS NULL OR email = '' OR length(email) > 64
+   OR (provider IS NOT NULL AND lower(provider) <> ALL(%(providers)s))
+   OR ((provider IS NULL) <> (provider_sub IS NULL))
+"""
+
+# Last row per valid email; later rows for the same email win
+STAGED_USERS_SQL = """
+SELECT DISTINCT ON (email)
+    email, left(first_name, 50) AS first_name, left(last_name, 50) AS last_name,
+    left(avatar_url, 255) AS avatar_url, is_active
+FROM user_import
+WHERE email <> '' AND length(email) <= 64
+ORDER BY email, seq DESC
+"""
+
+# Blank fields keep the stored value, is_active included, so a soft-deleted
+# user is only reactivated by an explicit true; unchanged users are not rewritten
+UPDATE_USERS_SQL = f"""
+UPDATE users SET
+    first_name = coalesce(s.first_name, users.first_name),
+    last_name = coalesce(s.last_name, users.last_name),
+    avatar_url = coalesce(s.avatar_url, users.avatar_url),
+    is_active = coalesce(s.is_active, users.is_active),
+    updated_at = now() AT TIME ZONE 'utc'
+FROM ({STAGED_USERS_SQL}) s
+WHERE users.email = s.email
+  AND (users.first_name, users.last_name, users.avatar_url, users.is_active)
+      IS DISTINCT FROM (coalesce(s.first_name, users.first_name), coalesce(s.last_name, users.last_name),
+                        coalesce(s.avatar_url, users.avatar_url), coalesce(s.is_active, users.is_active))
+"""
+
+# New users only; they default to active
+INSERT_USERS_SQL = f"""
+INSERT INTO users (id, email, first_name, last_name, avatar_url, is_active, created_at, updated_at)
+SELECT gen_random_uuid(), s.email, s.first_name, s.last_name, s.avatar_url,
+       coalesce(s.is_active, true), now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+FROM ({STAGED_USERS_SQL}) s
+WHERE NOT EXISTS (SELECT 1 FROM users u WHERE u.email = s.email)
+ON CONFLICT (email) DO NOTHING
+"""
+
+# An existing account keeps its user; only its profile fields are refreshed
+MERGE_ACCOUNTS_SQL = """
+WITH merged AS (
+    INSERT INTO oauth_accounts (id, user_id, provider, provider_sub, provider_email, provider_name, created_at, updated_at)
+    SELECT DISTINCT ON (lower(s.provider), s.provider_sub)
+        gen_random_uuid(), u.id, upper(s.provider)::oauthproviderenum, s.provider_sub,
+        left(s.provider_email, 255), left(s.provider_name, 100), now() AT TIME ZONE 'utc', now() AT TIME ZONE 'utc'
+    FROM user_import s
+    JOIN users u ON u.email = s.email
+    WHERE s.provider_sub IS NOT NULL AND lower(s.provider) = ANY(%(providers)s)
+    ORDER BY lower(s.provider), s.provider_sub, s.seq DESC
+    ON CONFLICT ON CONSTRAINT unique_provider_user DO UPDATE SET
+        provider_email = coalesce(excluded.provider_email, oauth_accounts.provider_email),
+        provider_name = coalesce(excluded.provider_name, oauth_accounts.provider_name),
+        updated_at = excluded.updated_at
+    WHERE (oauth_accounts.provider_email, oauth_accounts.provider_name)
+        IS DISTINCT FROM (coalesce(excluded.provider_email, oauth_accounts.provider_email),
+                          coalesce(excluded.provider_name, oauth_accounts.provider_name))
+    RETURNING xmax = 0 AS inserted
+)
+SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM merged
+"""
+
+EXPORT_QUERY = """
+SELECT u.email, u.first_name, u.last_name, u.avatar_url, u.is_active,
+       lower(a.provider::text) AS provider, a.provider_sub, a.provider_email, a.provider_name
+FROM users u
+LEFT JOIN oauth_accounts a ON a.user_id = u.id
+ORDER BY u.email, a.provider, a.provider_sub
+"""
+
+
+class _LineStream:
+    """File-like ``read()`` over an iterator of text chunks, for ``COPY FROM STDIN``."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, ""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _csv_value(value) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _ndjson_to_csv(lines: Iterable[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {number}: invalid JSON ({e.msg})") from None
+        if not isinstance(record, dict):
+            raise ValueError(f"line {number}: expected a JSON object")
+        # None becomes an unquoted empty field, which COPY reads as NULL
+        writer.writerow(["" if (v := _csv_value(record.get(column))) is None else v for column in USER_COLUMNS])
+        if buffer.tell() > 65536:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+class BulkUserService:
+    """Set-based import and export of users and their OAuth accounts.
+
+    Imports stream the file into a temporary staging table with ``COPY`` and
+    merge it into ``users`` (an update and an insert) and ``oauth_accounts``
+    (one upsert), all in a single transaction. Exports stream ``COPY TO STDOUT`` straight
+    into the output file.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def _cursor(self):
+        return self.db.connection().connection.cursor()
+
+    def import_csv(self, stream: IO[str]) -> dict:
+        """Load a CSV file whose header names a subset of ``USER_COLUMNS``."""
+        header = next(csv.reader([stream.readline()]), [])
+        columns = [name.strip() for name in header]
+        unknown = set(columns) - set(USER_COLUMNS)
+        if unknown or "email" not in columns:
+            raise ValueError(f"CSV header must include email and only {', '.join(USER_COLUMNS)}; got {header}")
+        # Postgres parses the rest of the file itself
+        return self._load(stream, columns)
+
+    def import_ndjson(self, stream: IO[str]) -> dict:
+        """Load one JSON object per line with keys from ``USER_COLUMNS``."""
+        return self._load(_LineStream(_ndjson_to_csv(stream)), list(USER_COLUMNS))
+
+    def _load(self, stream, columns: list[str]) -> dict:
+        """COPY ``stream`` into staging and merge it.
+
+        Blank fields never overwrite stored values; ``is_active`` defaults to
+        true only for new users, so soft-deleted users stay inactive.
+        """
+        try:
+            with self._cursor() as cursor:
+                # The merge sorts the whole file; keep that in memory
+                cursor.execute("SET LOCAL work_mem = '256MB'")
+                cursor.execute(STAGING_DDL)
+                cursor.copy_expert(f"COPY user_import ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", stream)
+                cursor.execute("SELECT count(*) FROM user_import")
+                rows = cursor.fetchone()[0]
+                # Temporary tables are never auto-analyzed; give the join real statistics
+                cursor.execute("ANALYZE user_import")
+                cursor.execute(INVALID_ROWS_SQL, {"providers": list(PROVIDERS)})
+                invalid = cursor.fetchone()[0]
+                cursor.execute(UPDATE_USERS_SQL)
+                users_updated = cursor.rowcount
+                cursor.execute(INSERT_USERS_SQL)
+                users_created = cursor.rowcount
+                cursor.execute(MERGE_ACCOUNTS_SQL, {"providers": list(PROVIDERS)})
+                accounts_created, accounts_updated = cursor.fetchone()
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+        return {
+            "rows": rows,
+            "invalid": invalid,
+            "users_created": users_created,
+            "users_updated": users_updated,
+            "accounts_created": accounts_created,
+            "accounts_updated": accounts_updated,
+        }
+
+    def export(self, out: IO, format: str = "csv") -> None:
+        """Write every user, one row per OAuth account, as CSV or NDJSON."""
+        if format == "csv":
+            sql = f"COPY ({EXPORT_QUERY}) TO STDOUT WITH (FORMAT csv, HEADER true)"
+        elif format == "ndjson":
+            # Control characters as quote and delimiter never occur in JSON
+            # output, so each row is written out verbatim
+            sql = (
+                f"COPY (SELECT row_to_json(t) FROM ({EXPORT_QUERY}) t) "
+                "TO STDOUT WITH (FORMAT csv, QUOTE e'\\x01', DELIMITER e'\\x02')"
+            )
+        else:
+            raise ValueError(f"Unsupported export format: {format}")
+        try:
+            with self._cursor() as cursor:
+                cursor.copy_expert(sql, out)
+        finally:
+            self.db.rollback()
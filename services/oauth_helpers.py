@@ -1,24 +1,27 @@
-import httpx
 from sqlalchemy.orm import Session
 from models.user import User
 from models.oauth import OAuthAccount, OAuthProviderEnum
 from core.security import encrypt_token
 from schemas.oauth import OAuthUserInfo
 from datetime import datetime, timedelta
+from core.tracing import span
+from core.lifecycle import http_client
 
 
 async def exchange_code_for_token(token_url: str, data: dict) -> dict:
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         headers = {'Content-Type': 'application/x-www-form-urlencoded'}
-        response = await client.post(token_url, data=data, headers=headers)
+        with span("http.oauth_token", url=token_url):
+            response = await client.post(token_url, data=data, headers=headers)
         response.raise_for_status()
         return response.json()
 
 
 async def fetch_user_info(userinfo_url: str, access_token: str) -> dict:
-    async with httpx.AsyncClient() as client:
+    async with http_client() as client:
         headers = {'Authorization': f'Bearer {access_token}'}
-        response = await client.get(userinfo_url, headers=headers)
+        with span("http.oauth_userinfo", url=userinfo_url):
+            response = await client.get(userinfo_url, headers=headers)
         response.raise_for_status()
         return response.json()
 
@@ -0,0 +1,180 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+from cachetools import TTLCache
+from fastapi import HTTPException
+from sqlalchemy import and_, exists, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from models.onboarding import OnboardingSummary, OnboardingTurn
+from models.resume import Resume
+from services.resume_service import get_gemini_client
+from utils import prompts
+from utils.singleflight import SingleFlight
+from core.config_loader import settings
+from core.tracing import span
+
+ONBOARDING_MODEL = "gemini-2.5-flash"
+
+# Follow-up questions asked after the welcome message, in display order
+ONBOARDING_STEPS: List[Tuple[str, str]] = [
+    ("current_work", prompts.current_work),
+    ("reason_for_interview", prompts.reason_for_interview),
+    ("where_in_interview_process", prompts.where_in_interview_process),
+    ("target_company", prompts.target_company),
+]
+
+# Rendered context prefix per (user id, resume version); a new upload bumps the
+# version, so stale prefixes are never served and simply age out
+_prefix_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+# A double-clicked start generates the opening questions once
+start_flight = SingleFlight("onboarding_start")
+
+
+def get_context_prefix(db: Session, user_id) -> str:
+    """The resume summary every onboarding prompt for ``user_id`` starts with.
+
+    Only the resume version is read on a cache hit; the summary itself is
+    loaded and rendered once per upload.
+    """
+    version = db.query(Resume.version).filter(Resume.user_id == user_id).scalar()
+    key = (user_id, version)
+    prefix = _prefix_cache.get(key)
+    if prefix is None:
+        summary = db.query(Resume.summary).filter(Resume.user_id == user_id).scalar() if version else None
+        prefix = f"context:\n{summary or 'The user has not shared a resume or LinkedIn profile yet.'}\n\n"
+        _prefix_cache[key] = prefix
+    return prefix
+
+
+async def generate_with_prefix(prefix: str, prompt: str) -> str:
+    # The shared context goes first so every call for the same user has an
+    # identical prompt prefix, which Gemini can serve from its implicit cache
+    with span("llm.generate", model=ONBOARDING_MODEL):
+        response = await get_gemini_client().aio.models.generate_content(
+            model=ONBOARDING_MODEL, contents=f"{prefix}{prompt}"
+        )
+    return response.text
+
+
+async def _generate_opening(prefix: str) -> Tuple[str, List[str]]:
+    welcome, *questions = await asyncio.gather(
+        generate_with_prefix(prefix, prompts.welcome_prompt),
+        *(generate_with_prefix(prefix, prompt) for _, prompt in ONBOARDING_STEPS),
+    )
+    return welcome, questions
+
+
+def get_onboarding(db: Session, user_id) -> Optional[OnboardingSummary]:
+    return db.query(OnboardingSummary).filter(OnboardingSummary.user_id == user_id).first()
+
+
+async def start_onboarding(db: Session, user_id) -> OnboardingSummary:
+    """Create the user's onboarding with every question generated up front.
+
+    The welcome message and the follow-up questions only depend on the
+    context, so they are generated concurrently; answering a turn afterwards
+    needs no model call until the final summary.
+    """
+    onboarding = get_onboarding(db, user_id)
+    if onboarding is not None:
+        return onboarding
+
+    prefix = get_context_prefix(db, user_id)
+    db.commit()
+    welcome, questions = await start_flight.do_async(user_id, _generate_opening, prefix)
+    onboarding = OnboardingSummary(user_id=user_id, status="in_progress", welcome_message=welcome)
+    onboarding.turns = [
+        OnboardingTurn(step=step, position=position, question=question)
+        for position, ((step, _), question) in enumerate(zip(ONBOARDING_STEPS, questions))
+    ]
+    db.add(onboarding)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent start for the same user won the unique user_id
+        db.rollback()
+        return get_onboarding(db, user_id)
+    db.refresh(onboarding)
+    return onboarding
+
+
+def _transcript(turns) -> str:
+    return "\n\n".join(f"Question: {question}\nAnswer: {answer}" for question, answer in turns)
+
+
+def _update_onboarding(db: Session, onboarding_id, *conditions, **values) -> int:
+    return db.execute(
+        update(OnboardingSummary).where(OnboardingSummary.id == onboarding_id, *conditions).values(**values)
+    ).rowcount
+
+
+async def answer_turn(db: Session, user_id, turn_id, answer: str) -> OnboardingSummary:
+    onboarding = get_onboarding(db, user_id)
+    if onboarding is None:
+        raise HTTPException(status_code=404, detail="Onboarding has not been started")
+    turn = next((t for t in onboarding.turns if t.id == turn_id), None)
+    if turn is None:
+        raise HTTPException(status_code=404, detail="Onboarding turn not found")
+    if onboarding.status == "completed":
+        raise HTTPException(status_code=409, detail="Onboarding is already completed")
+    # Claims are naive UTC, like every other timestamp compared in SQL here
+    stale_before = datetime.utcnow() - timedelta(seconds=settings.ONBOARDING_SUMMARY_CLAIM_SECONDS)
+    if onboarding.status == "summarizing" and onboarding.summary_claimed_at >= stale_before:
+        raise HTTPException(status_code=409, detail="Onboarding summary is being generated")
+
+    onboarding_id = onboarding.id
+    turn.answer = answer
+    turn.answered_at = datetime.now(timezone.utc)
+    prefix = get_context_prefix(db, user_id)
+    db.commit()
+
+    # Claim the summary once every turn is answered. The check runs after
+    # this answer is committed, so of two final answers landing together at
+    # least one sees both, and the status guard lets exactly one through. A
+    # claim whose worker died before finishing is taken over once it is stale
+    claimed_at = datetime.utcnow()
+    claimed = _update_onboarding(
+        db, onboarding_id,
+        or_(
+            OnboardingSummary.status == "in_progress",
+            and_(OnboardingSummary.status == "summarizing", OnboardingSummary.summary_claimed_at < stale_before),
+        ),
+        ~exists().where(OnboardingTurn.onboarding_id == onboarding_id, OnboardingTurn.answer.is_(None)),
+        status="summarizing",
+        summary_claimed_at=claimed_at,
+    )
+    turns = []
+    if claimed:
+        turns = (
+            db.query(OnboardingTurn.question, OnboardingTurn.answer)
+            .filter(OnboardingTurn.onboarding_id == onboarding_id)
+            .order_by(OnboardingTurn.position)
+            .all()
+        )
+    # Commit before the model call so no connection is held while waiting on it;
+    # nothing below touches the expired ORM state until the call returns
+    db.commit()
+    if claimed:
+        try:
+            summary = await generate_with_prefix(prefix, f"{prompts.onboarding_summary_prompt}\n\n{_transcript(turns)}")
+        except BaseException:
+            # Hand the summary back so the next answer retries it, unless
+            # another worker has taken the claim over meanwhile
+            _update_onboarding(
+                db, onboarding_id,
+                OnboardingSummary.status == "summarizing",
+                OnboardingSummary.summary_claimed_at == claimed_at,
+                status="in_progress",
+            )
+            db.commit()
+            raise
+        # The first summary to finish is kept, even if the claim was taken over
+        _update_onboarding(
+            db, onboarding_id,
+            OnboardingSummary.status == "summarizing",
+            status="completed", summary=summary, completed_at=datetime.now(timezone.utc),
+        )
+        db.commit()
+    return get_onboarding(db, user_id)
@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+import uuid
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from cachetools import LRUCache
+from sqlalchemy.orm import Session
+from core.config_loader import settings
+from core.database import SessionLocal
+from models.question import Question
+from schemas.question import QuestionCreate, QuestionResponse
+from utils.embeddings import EmbeddingFunction, get_embedding_function
+from utils.vector_index import build_index
+
+logger = logging.getLogger(__name__)
+
+
+class QuestionBank:
+    """Vector index over the ``questions`` table for top-k cosine retrieval.
+
+    Each worker holds the embeddings of every question in memory and rebuilds
+    the index from the database every ``ttl`` seconds, or right after it adds
+    questions itself. Rebuilds after the first run on a background thread
+    while searches keep using the previous index. Only rows embedded by the
+    configured embedding function are indexed, once in a bank-wide index and
+    once in an index per topic, so a search within a topic ranks only that
+    topic's questions and still fills k. Query embeddings are cached, so
+    repeated interview topics do not pay for an embedding call.
+    """
+
+    def __init__(self, embed: EmbeddingFunction, ann_threshold: int, ttl: float):
+        self.embed = embed
+        self.ann_threshold = ann_threshold
+        self.ttl = ttl
+        # (index, index per topic, questions by id), swapped as one unit so
+        # readers never see a mix
+        self._snapshot = None
+        # Monotonic times the snapshot was read from the database and last went stale
+        self._loaded_at = 0.0
+        self._invalidated_at = 0.0
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._query_cache: LRUCache = LRUCache(maxsize=1024)
+        self._query_cache_lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        started = time.monotonic()
+        rows = (
+            db.query(Question.id, Question.text, Question.topic, Question.embedding)
+            .filter(Question.embedding_model == self.embed.name)
+            .all()
+        )
+        vectors = np.frombuffer(b"".join(row.embedding for row in rows), dtype=np.float32)
+        vectors = vectors.reshape(len(rows), self.embed.dim)
+        ids = [row.id for row in rows]
+        questions = {row.id: QuestionResponse(id=row.id, text=row.text, topic=row.topic) for row in rows}
+        positions_by_topic = {}
+        for position, row in enumerate(rows):
+            if row.topic is not None:
+                positions_by_topic.setdefault(row.topic, []).append(position)
+        topic_indexes = {
+            topic: build_index(vectors[positions], [ids[p] for p in positions], self.ann_threshold)
+            for topic, positions in positions_by_topic.items()
+        }
+        self._snapshot = (build_index(vectors, ids, self.ann_threshold), topic_indexes, questions)
+        self._loaded_at = started
+
+    def _refresh(self) -> None:
+        try:
+            with SessionLocal() as db:
+                self.load(db)
+        except Exception:
+            # Keep serving the old index and try again after another ttl
+            logger.exception("Question index rebuild failed")
+            self._loaded_at = time.monotonic()
+        finally:
+            self._refreshing = False
+
+    def _current(self, db: Session):
+        if self._snapshot is None:
+            # Nothing to serve yet, so the first load has to happen inline
+            with self._lock:
+                if self._snapshot is None:
+                    self.load(db)
+        elif self._invalidated_at > self._loaded_at or time.monotonic() - self._loaded_at > self.ttl:
+            with self._lock:
+                start = not self._refreshing
+                self._refreshing = True
+            if start:
+                threading.Thread(target=self._refresh, name="question-index", daemon=True).start()
+        return self._snapshot
+
+    def add_questions(self, db: Session, items: Sequence[QuestionCreate]) -> List[QuestionResponse]:
+        vectors = self.embed([item.text for item in items]).astype(np.float32)
+        questions = [
+            Question(
+                id=uuid.uuid4(),
+                text=item.text,
+                topic=item.topic,
+                embedding=vector.tobytes(),
+                embedding_model=self.embed.name,
+            )
+            for item, vector in zip(items, vectors)
+        ]
+        created = [QuestionResponse(id=q.id, text=q.text, topic=q.topic) for q in questions]
+        db.add_all(questions)
+        db.commit()
+        # The next search starts a rebuild, and this worker sees its own
+        # additions once it lands; a rebuild already running may predate them
+        self._invalidated_at = time.monotonic()
+        return created
+
+    def _embed_queries(self, texts: Sequence[str]) -> np.ndarray:
+        # Vectors for this call live in a local dict; the shared cache may
+        # evict them while this batch is still being assembled
+        unique = list(dict.fromkeys(texts))
+        with self._query_cache_lock:
+            vectors = {text: self._query_cache[text] for text in unique if text in self._query_cache}
+        missing = [text for text in unique if text not in vectors]
+        if missing:
+            embedded = dict(zip(missing, self.embed(missing)))
+            vectors.update(embedded)
+            with self._query_cache_lock:
+                self._query_cache.update(embedded)
+        return np.stack([vectors[text] for text in texts])
+
+    def search_many(
+        self, db: Session, texts: Sequence[str], k: int = 5, topic: Optional[str] = None
+    ) -> List[List[Tuple[QuestionResponse, float]]]:
+        """Top-k questions for each of ``texts`` with one batched index lookup"""
+        index, topic_indexes, questions = self._current(db)
+        if topic is not None:
+            index = topic_indexes.get(topic)
+            if index is None:
+                return [[] for _ in texts]
+        return [
+            [(questions[qid], score) for qid, score in hits]
+            for hits in index.search(self._embed_queries(texts), k)
+        ]
+
+    def search(self, db: Session, text: str, k: int = 5, topic: Optional[str] = None) -> List[Tuple[QuestionResponse, float]]:
+        return self.search_many(db, [text], k=k, topic=topic)[0]
+
+
+@lru_cache
+def get_question_bank() -> QuestionBank:
+    return QuestionBank(
+        get_embedding_function(),
+        ann_threshold=settings.QUESTION_ANN_THRESHOLD,
+        ttl=settings.QUESTION_INDEX_TTL_SECONDS,
+    )
@@ -1,51 +1,158 @@
+import hashlib
 import os
-from fastapi import UploadFile
-from typing import Optional
-from utils.linkedin_scrapper import extract_text_from_cv, linkedin_scrapper
+import tempfile
+from functools import lru_cache
+from fastapi import HTTPException, UploadFile
+from typing import Callable, List, Optional, Tuple
+from utils.linkedin_scrapper import extract_text_from_cv, linkedin_scrapper, convert_linkedin_url_to_id
+from utils.singleflight import SingleFlight
 from models.resume import Resume
 from core.config_loader import settings
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert
+from datetime import datetime, timezone
 from google import genai
+from google.genai import types
 from utils import prompts
+from core.tracing import span
 
-def save_resume_file(file_bytes: bytes, filename: str, user_id: str) -> str:
+# Identical CVs and LinkedIn profiles share one extraction and Gemini call,
+# both while in flight and for a while after
+summary_flight = SingleFlight("resume_summary", ttl=settings.SUMMARY_CACHE_TTL_SECONDS)
+
+def stage_resume_file(file_bytes: bytes, filename: str, user_id: str) -> Tuple[str, str]:
+    """Write an upload next to its final place and return ``(staged_path, resume_path)``.
+
+    The staged file is only moved to ``resume_path`` once the upload has won
+    its conditional write, so a losing upload never touches the stored file.
+    """
     static_dir = os.path.join("static", str(user_id))
     os.makedirs(static_dir, exist_ok=True)
     resume_path = os.path.join(static_dir, filename)
-    with open(resume_path, "wb") as f:
+    fd, staged_path = tempfile.mkstemp(dir=static_dir, prefix=".upload-")
+    with os.fdopen(fd, "wb") as f:
         f.write(file_bytes)
-    return resume_path
+    return staged_path, resume_path
+
+@lru_cache
+def get_gemini_client() -> genai.Client:
+    http_options = types.HttpOptions(base_url=settings.GEMINI_BASE_URL) if settings.GEMINI_BASE_URL else None
+    return genai.Client(api_key=settings.GEMINI_API_KEY, http_options=http_options)
 
 def generate_summary_with_gemini(text: str, prompt: str) -> str:
-    client = genai.Client(api_key=settings.GEMINI_API_KEY,)  
-    response = client.models.generate_content(
-    model="gemini-2.5-flash", contents=f"""
+    contents = f"""
     {prompt}
     context:
-    {text}""")
+    {text}"""
+    with span("llm.generate", model="gemini-2.5-flash"):
+        response = get_gemini_client().models.generate_content(model="gemini-2.5-flash", contents=contents)
     return response.text
 
+def get_resume_version(db: Session, user_id: str) -> Optional[int]:
+    return db.query(Resume.version).filter(Resume.user_id == user_id).scalar()
+
+def upsert_resume(db: Session, user_id: str, expected_version: Optional[int], uploaded_at: datetime, resume_path: Optional[str], linkedin_url: Optional[str], summary: Optional[str], on_saved: Optional[Callable[[], None]] = None) -> Resume:
+    """Write the user's resume if it is still at ``expected_version``.
+
+    ``expected_version`` is the version read before the slow work, None when
+    the user had no resume yet. If another upload was saved in between, this
+    one is written over it only when it started strictly later; otherwise the
+    stored resume is kept and the lost race is reported with a 409.
+
+    ``on_saved`` runs after the write and before the commit, while the row is
+    still locked, so concurrent winners run it in the order they are saved.
+    If it raises, the write is rolled back.
+    """
+    values = {
+        "resume_path": resume_path,
+        "linkedin_url": linkedin_url,
+        "summary": summary,
+        "uploaded_at": uploaded_at,
+    }
+    while True:
+        if expected_version is None:
+            stmt = (
+                insert(Resume)
+                .values(user_id=user_id, version=1, **values)
+                .on_conflict_do_nothing(index_elements=[Resume.user_id])
+                .returning(Resume)
+            )
+        else:
+            stmt = (
+                update(Resume)
+                .where(Resume.user_id == user_id, Resume.version == expected_version)
+                .values(version=Resume.version + 1, **values)
+                .returning(Resume)
+            )
+        resume = db.scalars(stmt, execution_options={"populate_existing": True}).first()
+        if resume is not None:
+            if on_saved is not None:
+                try:
+                    on_saved()
+                except Exception:
+                    db.rollback()
+                    raise
+            db.commit()
+            db.refresh(resume)
+            return resume
+        # Another upload was saved first; only an older one may be replaced
+        stored = (
+            db.query(Resume.version, Resume.uploaded_at < uploaded_at)
+            .filter(Resume.user_id == user_id)
+            .first()
+        )
+        if stored is not None and not stored[1]:
+            db.rollback()
+            raise HTTPException(status_code=409, detail="A newer resume upload was saved first")
+        expected_version = stored[0] if stored is not None else None
+
+def summarize_cv(file_bytes: bytes) -> Optional[str]:
+    extracted_text = extract_text_from_cv(file_bytes)
+    return generate_summary_with_gemini(str(extracted_text), prompts.cv_prompt) if extracted_text else None
+
+def summarize_linkedin_profile(profile_url: str) -> Optional[str]:
+    extracted_text = linkedin_scrapper(profile_url)
+    return generate_summary_with_gemini(str(extracted_text), prompts.linkedin_prompt) if extracted_text else None
+
 def process_and_save_resume(db: Session, user_id: str, cv_file: Optional[UploadFile], linkedin_profile: Optional[str]) -> Resume:
     resume_path = None
-    extracted_text = None
+    staged_path = None
     summary = None
-    # Remove all previous resumes for this user to avoid conflicts
-    existing_resumes = db.query(Resume).filter(Resume.user_id == user_id).all()
-    for old_resume in existing_resumes:
-        db.delete(old_resume)
+    # Taken before the slow work so the upload that started last wins the upsert
+    uploaded_at = datetime.now(timezone.utc)
+    expected_version = get_resume_version(db, user_id)
+    # Release the connection while extracting and summarising
     db.commit()
-    if cv_file:
-        file_bytes = cv_file.file.read()
-        resume_path = save_resume_file(file_bytes, cv_file.filename, user_id)
-        extracted_text = extract_text_from_cv(file_bytes)
-        summary = generate_summary_with_gemini(str(extracted_text), prompts.cv_prompt) if extracted_text else None
-    elif linkedin_profile:
-        extracted_text = linkedin_scrapper(linkedin_profile)
-        summary = generate_summary_with_gemini(str(extracted_text), prompts.linkedin_prompt) if extracted_text else None
-    else:
-        extracted_text = None
-    resume = Resume(user_id=user_id, resume_path=resume_path, linkedin_url=linkedin_profile, summary=summary)
-    db.add(resume)
-    db.commit()
-    db.refresh(resume)
-    return resume 
\ No newline at end of file
+    try:
+        if cv_file:
+            file_bytes = cv_file.file.read()
+            staged_path, resume_path = stage_resume_file(file_bytes, cv_file.filename, user_id)
+            key = ("cv", hashlib.sha256(file_bytes).hexdigest())
+            summary = summary_flight.do(key, summarize_cv, file_bytes)
+        elif linkedin_profile:
+            key = ("linkedin", convert_linkedin_url_to_id(linkedin_profile))
+            summary = summary_flight.do(key, summarize_linkedin_profile, linkedin_profile)
+        on_saved = (lambda: os.replace(staged_path, resume_path)) if staged_path else None
+        return upsert_resume(db, user_id, expected_version, uploaded_at, resume_path, linkedin_profile, summary, on_saved)
+    finally:
+        # Left over when the upload lost its race (409) or failed
+        if staged_path and os.path.exists(staged_path):
+            os.remove(staged_path)
+
+def search_resumes(db: Session, query: str, skip: int = 0, limit: int = 20) -> List[Tuple[Resume, float]]:
+    """Full-text search over resume summaries, best matches first.
+
+    ``query`` accepts web search syntax ("python -java", "\"team lead\"") and
+    is matched through the GIN index on ``summary_tsv``.
+    """
+    tsquery = func.websearch_to_tsquery("english", query)
+    rank = func.ts_rank_cd(Resume.summary_tsv, tsquery).label("rank")
+    return (
+        db.query(Resume, rank)
+        .filter(Resume.summary_tsv.bool_op("@@")(tsquery))
+        .order_by(rank.desc(), Resume.id)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
@@ -0,0 +1,74 @@
+import asyncio
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional, Set
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+from core.database import SessionLocal
+from models.user import User
+from services.user_service import UserService
+
+
+class UserLoader:
+    """Worker-wide loader that merges concurrent user lookups into one query.
+
+    ``load`` calls made before the event loop gets back to the loader, from
+    one request (e.g. inside one ``asyncio.gather``) or from many concurrent
+    ones, are answered by a single ``UserService.get_users_by_ids`` run in
+    the threadpool on its own session. Nothing is cached past the batch, so
+    every lookup sees the database as of its batch.
+
+    Batches read from the primary: one batch serves many clients, and some of
+    them may need to see their own writes.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self.session_factory = session_factory
+        # Open batch per event loop, keyed by user id
+        self._batches: Dict[asyncio.AbstractEventLoop, Dict[uuid.UUID, asyncio.Future]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def load(self, user_id: uuid.UUID) -> Optional[User]:
+        loop = asyncio.get_running_loop()
+        batch = self._batches.get(loop)
+        if batch is None:
+            batch = self._batches[loop] = {}
+            loop.call_soon(self._dispatch, loop)
+        future = batch.get(user_id)
+        if future is None:
+            future = batch[user_id] = loop.create_future()
+        # A cancelled caller must not cancel the lookup others share
+        return await asyncio.shield(future)
+
+    async def load_many(self, user_ids: Iterable[uuid.UUID]) -> List[Optional[User]]:
+        return list(await asyncio.gather(*(self.load(user_id) for user_id in user_ids)))
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop) -> None:
+        batch = self._batches.pop(loop)
+        task = loop.create_task(self._resolve(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _fetch(self, user_ids: List[uuid.UUID]) -> List[Optional[User]]:
+        with self.session_factory() as db:
+            return UserService(db).get_users_by_ids(user_ids)
+
+    async def _resolve(self, batch: Dict[uuid.UUID, asyncio.Future]) -> None:
+        user_ids = list(batch)
+        try:
+            users = await run_in_threadpool(self._fetch, user_ids)
+        except Exception as exc:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for user_id, user in zip(user_ids, users):
+            future = batch[user_id]
+            if not future.done():
+                future.set_result(user)
+
+
+user_loader = UserLoader()
+
+
+def get_user_loader() -> UserLoader:
+    return user_loader
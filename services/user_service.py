@@ -1,10 +1,13 @@
+from sqlalchemy import any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from datetime import datetime, timezone
 from models.user import User
 from schemas.user import UserCreate, UserUpdate
 from fastapi import HTTPException, status
 import os
+import uuid
 from fastapi import UploadFile
 
 class UserService:
@@ -19,6 +22,14 @@ class UserService:
         """Get user by email"""
         return self.db.query(User).filter(User.email == email).first()
 
+    def get_users_by_ids(self, user_ids: Sequence[uuid.UUID]) -> List[Optional[User]]:
+        """Get users in request order with one query, None for unknown ids"""
+        if not user_ids:
+            return []
+        ids = bindparam("ids", value=list(set(user_ids)), type_=ARRAY(UUID(as_uuid=True)))
+        found = {user.id: user for user in self.db.query(User).filter(User.id == any_(ids)).all()}
+        return [found.get(user_id) for user_id in user_ids]
+
     def get_users(self, skip: int = 0, limit: int = 100) -> List[User]:
         """Get paginated list of users"""
         return self.db.query(User).offset(skip).limit(limit).all()
@@ -0,0 +1,79 @@
+import os
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import sessionmaker
+
+# Scratch Postgres for the tests that need a real database, e.g.
+# TEST_POSTGRES_DSN=postgresql://u:p@localhost:5433/scratch python -m pytest tests
+TEST_POSTGRES_DSN = os.environ.get("TEST_POSTGRES_DSN")
+SCHEMA = "pytest"
+
+# Settings() needs these at import time; real values are never used here
+_TEST_ENV = {
+    "SECRET_KEY": "test-secret-key-test-secret-key-test-secret-key",
+    "GOOGLE_CLIENT_ID": "test",
+    "GOOGLE_CLIENT_SECRET": "test",
+    "GEMINI_API_KEY": "test",
+    "LINKEDIN_CLIENT_ID": "test",
+    "LINKEDIN_CLIENT_SECRET": "test",
+    "LINKEDIN_EMAIL": "test",
+    "LINKEDIN_PASSWORD": "test",
+    "FRONTEND_URL": "http://localhost:3000",
+    "POSTGRESQL_USERNAME": "test",
+    "POSTGRESQL_PASSWORD": "test",
+    "POSTGRESQL_SERVER": "localhost",
+    "POSTGRESQL_PORT": "5432",
+    "POSTGRESQL_DATABASE": "test",
+}
+if TEST_POSTGRES_DSN:
+    _url = make_url(TEST_POSTGRES_DSN)
+    _TEST_ENV.update(
+        {
+            "POSTGRESQL_USERNAME": _url.username,
+            "POSTGRESQL_PASSWORD": _url.password or "",
+            "POSTGRESQL_SERVER": _url.host,
+            "POSTGRESQL_PORT": str(_url.port or 5432),
+            "POSTGRESQL_DATABASE": _url.database,
+        }
+    )
+for key, value in _TEST_ENV.items():
+    os.environ.setdefault(key, value)
+
+
+@pytest.fixture(scope="session")
+def postgres():
+    """Sessionmaker on a private schema of ``TEST_POSTGRES_DSN`` with the users and resume tables."""
+    if not TEST_POSTGRES_DSN:
+        pytest.skip("TEST_POSTGRES_DSN is not set")
+    from core.database import Base
+    import models.oauth  # noqa: F401  (resolve the User.oauth_accounts relationship)
+    from models.resume import Resume
+    from models.user import User
+
+    engine = create_engine(TEST_POSTGRES_DSN, connect_args={"options": f"-csearch_path={SCHEMA}"}, pool_size=20)
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    Base.metadata.create_all(engine, tables=[User.__table__, Resume.__table__])
+    try:
+        yield sessionmaker(bind=engine)
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        engine.dispose()
+
+
+@pytest.fixture
+def user_id(postgres):
+    from models.user import User
+
+    with postgres() as db:
+        now = datetime.now(timezone.utc)
+        user = User(id=uuid.uuid4(), email=f"{uuid.uuid4().hex[:16]}@example.com", created_at=now, updated_at=now)
+        db.add(user)
+        db.commit()
+        return user.id
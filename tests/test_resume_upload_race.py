@@ -0,0 +1,173 @@
+"""Concurrent resume uploads of one user through ``process_and_save_resume``.
+
+Extraction and Gemini are replaced by a stub that can be held open, so the
+tests decide in which order uploads start and finish. Uploads run in
+threads, each on its own session, against the Postgres of ``TEST_POSTGRES_DSN``.
+"""
+import io
+import os
+import random
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from models.resume import Resume
+from services import resume_service
+from utils.singleflight import SingleFlight
+
+
+class HeldFile(io.BytesIO):
+    """An upload body whose read waits for ``release``, like a slow client."""
+
+    def __init__(self, content: bytes):
+        super().__init__(content)
+        self.entered, self.release = threading.Event(), threading.Event()
+
+    def read(self, *args):
+        self.entered.set()
+        self.release.wait(10)
+        return super().read(*args)
+
+
+class Uploads:
+    """Runs uploads in threads and records how each one ended."""
+
+    def __init__(self, postgres, user_id):
+        self.postgres = postgres
+        self.user_id = user_id
+        self.outcomes = {}
+        self.threads = []
+
+    def start(self, content, name: str = None) -> threading.Thread:
+        thread = threading.Thread(target=self._upload, args=(content,), name=name)
+        self.threads.append(thread)
+        thread.start()
+        return thread
+
+    def _upload(self, content) -> None:
+        db = self.postgres()
+        try:
+            body = content if isinstance(content, io.BytesIO) else io.BytesIO(content)
+            content = body.getvalue()
+            cv_file = UploadFile(file=body, filename="cv.pdf")
+            resume_service.process_and_save_resume(db, self.user_id, cv_file, None)
+            self.outcomes[content] = "saved"
+        except HTTPException as e:
+            self.outcomes[content] = e.status_code
+        finally:
+            db.close()
+
+    def join(self) -> dict:
+        for thread in self.threads:
+            thread.join(timeout=30)
+        return self.outcomes
+
+    def stored(self):
+        with self.postgres() as db:
+            return db.query(Resume).filter(Resume.user_id == self.user_id).one()
+
+
+@pytest.fixture
+def uploads(postgres, user_id, tmp_path, monkeypatch):
+    # Files land in static/<user_id>/ under the working directory
+    monkeypatch.chdir(tmp_path)
+    # Summaries of identical uploads would otherwise be cached across tests
+    monkeypatch.setattr(resume_service, "summary_flight", SingleFlight("test_resume_summary"))
+    return Uploads(postgres, user_id)
+
+
+def _user_dir(user_id) -> str:
+    return os.path.join("static", str(user_id))
+
+
+def _stored_file(resume: Resume) -> bytes:
+    with open(resume.resume_path, "rb") as f:
+        return f.read()
+
+
+def _leftovers(user_id) -> list:
+    return [name for name in os.listdir(_user_dir(user_id)) if name != "cv.pdf"]
+
+
+def test_later_upload_wins_when_it_finishes_first(uploads, user_id, monkeypatch):
+    monkeypatch.setattr(resume_service, "summarize_cv", lambda file_bytes: f"summary of {file_bytes.decode()}")
+    held = HeldFile(b"first")
+    first = uploads.start(held)
+    assert held.entered.wait(10)
+    uploads.start(b"second").join(10)
+    # The older upload only now writes its file, after the newer one was saved
+    held.release.set()
+    first.join(10)
+
+    assert uploads.join() == {b"second": "saved", b"first": 409}
+    resume = uploads.stored()
+    assert (resume.summary, resume.version) == ("summary of second", 1)
+    # The losing upload neither replaced the stored file nor left its own behind
+    assert _stored_file(resume) == b"second"
+    assert _leftovers(user_id) == []
+
+
+def test_later_upload_wins_when_it_finishes_last(uploads, user_id, monkeypatch):
+    entered, release = threading.Event(), threading.Event()
+
+    def summarize_cv(file_bytes):
+        if file_bytes == b"second":
+            entered.set()
+            release.wait(10)
+        return f"summary of {file_bytes.decode()}"
+
+    monkeypatch.setattr(resume_service, "summarize_cv", summarize_cv)
+    uploads.start(b"base").join(10)
+    first = uploads.start(b"first")
+    time.sleep(0.01)
+    second = uploads.start(b"second")
+    assert entered.wait(10)
+    first.join(10)
+    release.set()
+    second.join(10)
+
+    assert uploads.join() == {b"base": "saved", b"first": "saved", b"second": "saved"}
+    resume = uploads.stored()
+    assert (resume.summary, resume.version) == ("summary of second", 3)
+    assert _stored_file(resume) == b"second"
+    assert _leftovers(user_id) == []
+
+
+@pytest.mark.parametrize("previous", [0, 1])
+def test_parallel_uploads_keep_the_last_started(uploads, user_id, monkeypatch, previous):
+    count = 12
+    read_versions = [threading.Event() for _ in range(count)]
+    get_resume_version = resume_service.get_resume_version
+
+    def ordered_get_resume_version(db, user_id):
+        # Upload i starts only after upload i-1 read the version, so start
+        # times follow the indexes while finishing order stays random
+        index = int(threading.current_thread().name)
+        if index:
+            read_versions[index - 1].wait(10)
+        try:
+            return get_resume_version(db, user_id)
+        finally:
+            read_versions[index].set()
+
+    def summarize_cv(file_bytes):
+        time.sleep(random.uniform(0, 0.05))
+        return f"summary of {file_bytes.decode()}"
+
+    monkeypatch.setattr(resume_service, "summarize_cv", summarize_cv)
+    if previous:
+        uploads.start(b"previous").join(10)
+    monkeypatch.setattr(resume_service, "get_resume_version", ordered_get_resume_version)
+    for index in range(count):
+        uploads.start(f"upload {index}".encode(), name=str(index))
+
+    outcomes = uploads.join()
+    assert set(outcomes.values()) <= {"saved", 409}
+    assert outcomes[f"upload {count - 1}".encode()] == "saved"
+    resume = uploads.stored()
+    assert resume.summary == f"summary of upload {count - 1}"
+    assert resume.version == sum(1 for outcome in outcomes.values() if outcome == "saved")
+    assert _stored_file(resume) == f"upload {count - 1}".encode()
+    assert _leftovers(user_id) == []
@@ -0,0 +1,73 @@
+import hashlib
+import re
+from functools import lru_cache
+from typing import Protocol, Sequence
+import numpy as np
+from google import genai
+from google.genai import types
+from core.config_loader import settings
+from core.tracing import span
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+class EmbeddingFunction(Protocol):
+    name: str
+    dim: int
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed ``texts`` into a ``(len(texts), dim)`` float32 array."""
+        ...
+
+
+class HashingEmbedding:
+    """Deterministic bag-of-words feature hashing; needs no network or model.
+
+    Good enough for keyword-level similarity and for running offline in
+    tests and benchmarks.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+
+    def _features(self, text: str):
+        tokens = _TOKEN.findall(text.lower())
+        for feature in tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]:
+            digest = hashlib.blake2b(feature.encode(), digest_size=8).digest()
+            value = int.from_bytes(digest, "little")
+            yield value % self.dim, 1.0 if value >> 63 else -1.0
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for column, sign in self._features(text):
+                out[row, column] += sign
+        return out
+
+
+class GeminiEmbedding:
+    BATCH_SIZE = 100
+
+    def __init__(self, model: str = "text-embedding-004"):
+        http_options = types.HttpOptions(base_url=settings.GEMINI_BASE_URL) if settings.GEMINI_BASE_URL else None
+        self.client = genai.Client(api_key=settings.GEMINI_API_KEY, http_options=http_options)
+        self.model = model
+        self.name = f"gemini-{model}"
+        self.dim = 768
+
+    def __call__(self, texts: Sequence[str]) -> np.ndarray:
+        vectors = []
+        for start in range(0, len(texts), self.BATCH_SIZE):
+            batch = list(texts[start:start + self.BATCH_SIZE])
+            with span("llm.embed", model=self.model, batch_size=len(batch)):
+                response = self.client.models.embed_content(model=self.model, contents=batch)
+            vectors.extend(embedding.values for embedding in response.embeddings)
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), self.dim)
+
+
+@lru_cache
+def get_embedding_function() -> EmbeddingFunction:
+    if settings.EMBEDDING_BACKEND == "hashing":
+        return HashingEmbedding()
+    return GeminiEmbedding()
@@ -31,7 +31,7 @@ target_company: str = "Using the following text as a context ask a question in o
 
 onboarding_summary_prompt: str = "Create a summary using the following data"
 
-# Configure the embedding function
+# Embedding function: utils/embeddings.py, retrieval: services/question_service.py
 
 interviewer_question_fetch_prompt = "You are a high level manager of the company. You are taking the interview of a candidate."\
                                     "The following is the summary generated by our system. Use it and grab the suitable questions from the database"
\ No newline at end of file
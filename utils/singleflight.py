@@ -0,0 +1,121 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set
+from cachetools import TTLCache
+
+singleflights: Dict[str, "SingleFlight"] = {}
+
+
+class SingleFlight:
+    """Run a computation once for all concurrent callers with the same key.
+
+    The first caller for a key (the leader) runs the function; callers that
+    arrive while it runs wait for and share its result or exception. With
+    ``ttl`` set, successful non-None results are also kept that many seconds
+    so later identical calls skip the work entirely; failures and None are
+    never cached.
+
+    ``do`` is for threads (e.g. the blocking-work executor) and ``do_async``
+    for coroutines on the event loop; both share the same in-flight table,
+    so a thread and a coroutine asking for one key coalesce as well. Async
+    work runs in a task of its own, so it finishes for everyone else even
+    when the request that started it is cancelled.
+    """
+
+    def __init__(self, name: str, ttl: float = 0.0, maxsize: int = 1024):
+        self.name = name
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+        self._results: Optional[TTLCache] = TTLCache(maxsize=maxsize, ttl=ttl) if ttl > 0 else None
+        self.executions = 0
+        self.coalesced = 0
+        self.cache_hits = 0
+        self.errors = 0
+        # Strong references to running async work, which the loop only holds weakly
+        self._tasks: Set[asyncio.Task] = set()
+        singleflights[name] = self
+
+    def _join(self, key: Hashable):
+        """Return ``(cached, future, leader)`` for ``key`` under the lock."""
+        with self._lock:
+            if self._results is not None and key in self._results:
+                self.cache_hits += 1
+                return self._results[key], None, False
+            future = self._inflight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future, False
+            future = self._inflight[key] = Future()
+            # Running futures cannot be cancelled, so a waiter that goes away
+            # never cancels the result the others are waiting for
+            future.set_running_or_notify_cancel()
+            self.executions += 1
+            return None, future, True
+
+    def _finish(self, key: Hashable, future: Future, result: Any = None, error: Optional[BaseException] = None) -> None:
+        # Cache and leave the in-flight table in one step, so a caller arriving
+        # in between finds one or the other and never starts a second run
+        with self._lock:
+            if error is None and result is not None and self._results is not None:
+                self._results[key] = result
+            if error is not None:
+                self.errors += 1
+            del self._inflight[key]
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        cached, future, leader = self._join(key)
+        if future is None:
+            return cached
+        if not leader:
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        self._finish(key, future, result)
+        return result
+
+    async def do_async(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        cached, future, leader = self._join(key)
+        if future is None:
+            return cached
+        if leader:
+            try:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+            except BaseException as e:
+                self._finish(key, future, error=e)
+                raise
+            self._tasks.add(task)
+            task.add_done_callback(lambda done: self._finish_task(key, future, done))
+        # Awaiting through wrap_future never cancels the running Future, so a
+        # caller that goes away, the leader included, leaves the others waiting
+        return await asyncio.wrap_future(future)
+
+    def _finish_task(self, key: Hashable, future: Future, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if task.cancelled():
+            # Only the loop shutting down cancels the task itself
+            self._finish(key, future, error=asyncio.CancelledError())
+        elif task.exception() is not None:
+            self._finish(key, future, error=task.exception())
+        else:
+            self._finish(key, future, task.result())
+
+    def stats(self) -> dict:
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+            "in_flight": len(self._inflight),
+        }
+
+
+def singleflight_stats() -> dict:
+    return {name: flight.stats() for name, flight in singleflights.items()}
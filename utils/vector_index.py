@@ -0,0 +1,97 @@
+import numpy as np
+
+
+def normalize(vectors: np.ndarray) -> np.ndarray:
+    """Row-wise L2 normalisation so a dot product is the cosine similarity."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the k best scores per row, best first."""
+    k = min(k, scores.shape[1])
+    if k == 0:
+        return np.empty((scores.shape[0], 0), dtype=np.int64)
+    part = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(scores, part, axis=1), axis=1)
+    return np.take_along_axis(part, order, axis=1)
+
+
+class ExactIndex:
+    """Brute-force cosine search: one matrix product per batch of queries."""
+
+    def __init__(self, vectors: np.ndarray, ids: list):
+        self.vectors = normalize(vectors)
+        self.ids = list(ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def search(self, queries: np.ndarray, k: int) -> list[list[tuple]]:
+        """Return ``(id, score)`` pairs, best first, for each query row."""
+        if not self.ids:
+            return [[] for _ in range(len(queries))]
+        scores = normalize(queries) @ self.vectors.T
+        best = _top_k(scores, k)
+        return [
+            [(self.ids[j], float(scores[row, j])) for j in best[row]]
+            for row in range(len(best))
+        ]
+
+
+class IVFIndex:
+    """Inverted-file ANN index: k-means cells, only ``nprobe`` cells scanned per query.
+
+    Trades a little recall for scanning roughly ``nprobe / nlist`` of the
+    bank, which keeps large banks within a few milliseconds.
+    """
+
+    def __init__(self, vectors: np.ndarray, ids: list, nlist: int | None = None, nprobe: int = 8,
+                 iterations: int = 10, seed: int = 0):
+        self.vectors = normalize(vectors)
+        self.ids = list(ids)
+        self.nlist = nlist or max(int(np.sqrt(len(self.ids))), 1)
+        self.nprobe = min(nprobe, self.nlist)
+        self.centroids = self._train(iterations, np.random.default_rng(seed))
+        assignments = np.argmax(self.vectors @ self.centroids.T, axis=1)
+        self.cells = [np.flatnonzero(assignments == c) for c in range(self.nlist)]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _train(self, iterations: int, rng: np.random.Generator) -> np.ndarray:
+        # Spherical k-means on a sample; the full bank is only needed for assignment
+        sample_size = min(len(self.vectors), self.nlist * 64)
+        sample = self.vectors[rng.choice(len(self.vectors), sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, self.nlist, replace=False)]
+        for _ in range(iterations):
+            assignments = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, sample)
+            empty = ~np.bincount(assignments, minlength=self.nlist).astype(bool)
+            sums[empty] = centroids[empty]
+            centroids = normalize(sums)
+        return centroids
+
+    def search(self, queries: np.ndarray, k: int) -> list[list[tuple]]:
+        queries = normalize(queries)
+        probes = _top_k(queries @ self.centroids.T, self.nprobe)
+        results = []
+        for query, cells in zip(queries, probes):
+            candidates = np.concatenate([self.cells[c] for c in cells])
+            if not len(candidates):
+                results.append([])
+                continue
+            scores = self.vectors[candidates] @ query
+            best = _top_k(scores[np.newaxis, :], k)[0]
+            results.append([(self.ids[candidates[j]], float(scores[j])) for j in best])
+        return results
+
+
+def build_index(vectors: np.ndarray, ids: list, ann_threshold: int):
+    """Exact search for small banks, IVF once the bank reaches ``ann_threshold``."""
+    if len(ids) >= ann_threshold:
+        return IVFIndex(vectors, ids)
+    return ExactIndex(vectors, ids)